@@ -0,0 +1,217 @@
+"""Throughput and latency of every GET route in the portfolio and admin blueprints
+
+Each route is driven by a pool of client threads, either in-process through
+the Flask test client or over HTTP against a threaded WSGI server (or an
+already running one with --url, e.g. gunicorn). Results are written as JSON
+for benchmarks/compare.py.
+
+Usage: python benchmarks/api.py [--scale 10|10k|1m] [--mode client|wsgi|both]
+                                [--duration S] [--concurrency N] [--db PATH]
+                                [--url URL] [--output FILE]
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.serving import make_server
+
+from seed import SCALES, seed
+from src.main import create_app
+from src.models.portfolio import Project
+from src.services.query_audit import route_urls
+
+ADMIN_LOGIN = {'username': 'admin', 'password': 'admin123'}
+
+# Serves files from IMAGE_SOURCE_DIR, which the synthetic data doesn't populate
+SKIPPED_ENDPOINTS = {'portfolio.get_image'}
+
+class TestClientSession:
+    def __init__(self, app):
+        self.client = app.test_client()
+        self.client.post('/api/admin/login', json=ADMIN_LOGIN)
+    
+    def get(self, url):
+        response = self.client.get(url)
+        response.get_data()
+        return response.status_code
+    
+    def close(self):
+        pass
+
+class HTTPSession:
+    """Keep-alive HTTP connection carrying the admin session cookie"""
+    
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        self.cookie = None
+        body = json.dumps(ADMIN_LOGIN)
+        status, headers = self._request('POST', '/api/admin/login', body, {'Content-Type': 'application/json'})
+        cookie = headers.get('Set-Cookie')
+        if cookie:
+            self.cookie = cookie.split(';', 1)[0]
+    
+    def _request(self, method, url, body=None, headers=None):
+        headers = dict(headers or {})
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        for attempt in range(2):
+            try:
+                self.connection.request(method, url, body=body, headers=headers)
+                response = self.connection.getresponse()
+                response.read()
+                return response.status, response.headers
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed the keep-alive connection; reconnect once
+                self.connection.close()
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+                if attempt:
+                    raise
+    
+    def get(self, url):
+        return self._request('GET', url)[0]
+    
+    def close(self):
+        self.connection.close()
+
+def measure(make_session, url, duration, concurrency):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    ready = threading.Barrier(concurrency + 1)
+    stop = threading.Event()
+    
+    def worker():
+        session = make_session()
+        session.get(url)  # warm up
+        local, failed = [], 0
+        ready.wait()
+        while not stop.is_set():
+            started = time.perf_counter()
+            status = session.get(url)
+            local.append(time.perf_counter() - started)
+            failed += status >= 400
+        session.close()
+        with lock:
+            latencies.extend(local)
+            errors.append(failed)
+    
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    started = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    
+    def percentile(p):
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 3) if latencies else None
+    
+    return {
+        'requests': len(latencies),
+        'errors': sum(errors),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def run_mode(app, mode, urls, args):
+    server = None
+    if mode == 'client':
+        make_session = lambda: TestClientSession(app)
+    elif args.url:
+        make_session = lambda: HTTPSession(args.url)
+    else:
+        logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+        make_session = lambda: HTTPSession(base_url)
+    
+    results = {}
+    try:
+        for endpoint, url in urls:
+            result = measure(make_session, url, args.duration, args.concurrency)
+            results[url] = dict(result, endpoint=endpoint)
+            print(f"{mode:<6} {url:<48} {result['rps']:9.1f} req/s  p50 {result['p50_ms']:8.2f} ms  "
+                  f"p99 {result['p99_ms']:8.2f} ms  errors {result['errors']}")
+    finally:
+        if server:
+            server.shutdown()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='10')
+    parser.add_argument('--mode', choices=('client', 'wsgi', 'both'), default='both')
+    parser.add_argument('--duration', type=float, default=2.0, help='seconds per route')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--db', help='reuse (or create) this database instead of a temporary one')
+    parser.add_argument('--url', help='benchmark a running server instead of an in-process one')
+    parser.add_argument('--output', help='write JSON results to this file')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.abspath(args.db or os.path.join(tmp, 'bench.db'))
+        fresh = not os.path.exists(path)
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+            'RATELIMIT_ENABLED': False,
+            'METRICS_SLOW_QUERY_MS': None,
+        })
+        with app.app_context():
+            if fresh:
+                started = time.perf_counter()
+                seed(args.scale)
+                print(f'Seeded scale {args.scale} in {time.perf_counter() - started:.1f}s')
+            project = Project.query.order_by(Project.id).first()
+            sample_ids = {'project_id': project.id if project else 1}
+        urls = [(endpoint, url) for endpoint, url in route_urls(app, sample_ids=sample_ids)
+                if endpoint not in SKIPPED_ENDPOINTS]
+        
+        modes = ('client', 'wsgi') if args.mode == 'both' else (args.mode,)
+        report = {
+            'meta': {
+                'commit': git_commit(),
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'scale': args.scale,
+                'duration': args.duration,
+                'concurrency': args.concurrency,
+            },
+            'results': {mode: run_mode(app, mode, urls, args) for mode in modes},
+        }
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results written to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Concurrent-connection capacity: WSGI (gunicorn or Werkzeug) vs the ASGI entry point
+
+Opens a number of slow clients that trickle their request headers one byte at a
+time, the way a slow mobile connection does, and meanwhile measures normal
+requests to /api/portfolio/projects. A thread-per-request server runs out of
+threads once the slow clients occupy them; an async server keeps answering.
+
+Usage: python benchmarks/asgi_capacity.py [slow clients,...] [seconds]
+       e.g. python benchmarks/asgi_capacity.py 0,50,200,1000 5
+"""
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+PROBE_PATH = '/api/portfolio/projects'
+WORKERS = 2
+THREADS = 8
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def servers(port):
+    """(label, command) for every server available in this environment"""
+    if shutil.which('gunicorn'):
+        yield 'wsgi gunicorn', ['gunicorn', '-w', str(WORKERS), '--threads', str(THREADS),
+                                '-b', f'127.0.0.1:{port}', 'src.main:create_app()']
+    else:
+        yield 'wsgi werkzeug', [sys.executable, '-m', 'flask', '--app', 'src.main:create_app()', 'run',
+                                '--with-threads', '--port', str(port)]
+    if shutil.which('uvicorn'):
+        yield 'asgi uvicorn', ['uvicorn', '--workers', str(WORKERS), '--port', str(port),
+                               '--log-level', 'warning', 'src.asgi:app']
+
+async def slow_client(port, stop):
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    except OSError:
+        return
+    request = f'GET {PROBE_PATH} HTTP/1.1\r\nHost: localhost\r\nX-Padding: {"x" * 200}\r\n\r\n'.encode()
+    try:
+        for byte in request:
+            if stop.is_set():
+                break
+            writer.write(bytes([byte]))
+            await writer.drain()
+            await asyncio.sleep(0.5)
+    except OSError:
+        pass
+    finally:
+        writer.close()
+
+async def probe(port, timeout=5):
+    started = time.perf_counter()
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', port), timeout)
+        writer.write(f'GET {PROBE_PATH} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode())
+        await writer.drain()
+        status = await asyncio.wait_for(reader.readline(), timeout)
+        await asyncio.wait_for(reader.read(), timeout)
+        writer.close()
+        ok = b' 200 ' in status
+    except (OSError, asyncio.TimeoutError):
+        ok = False
+    return ok, time.perf_counter() - started
+
+async def measure(port, slow, seconds):
+    stop = asyncio.Event()
+    slow_tasks = [asyncio.create_task(slow_client(port, stop)) for _ in range(slow)]
+    await asyncio.sleep(1)  # let the slow clients connect and start trickling
+    
+    results = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        results.extend(await asyncio.gather(*(probe(port) for _ in range(4))))
+    
+    stop.set()
+    for task in slow_tasks:
+        task.cancel()
+    await asyncio.gather(*slow_tasks, return_exceptions=True)
+    
+    latencies = sorted(elapsed for ok, elapsed in results if ok)
+    return {
+        'ok': len(latencies),
+        'failed': len(results) - len(latencies),
+        'p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else float('nan'),
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float('nan'),
+    }
+
+def wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with socket.socket() as s:
+            if s.connect_ex(('127.0.0.1', port)) == 0:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f'server did not start on port {port}')
+
+def main():
+    levels = [int(n) for n in (sys.argv[1] if len(sys.argv) > 1 else '0,50,200,1000').split(',')]
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    
+    from src.commands import init_db, init_default_data
+    from src.main import create_app
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{os.path.join(tmp, 'capacity.db')}"
+        env = dict(os.environ, DATABASE_URL=uri)
+        with create_app({'SQLALCHEMY_DATABASE_URI': uri}).app_context():
+            init_db()
+            init_default_data()
+        
+        print(f'{WORKERS} workers; probes of GET {PROBE_PATH} for {seconds:g}s per level')
+        port = free_port()
+        for label, command in servers(port):
+            server = subprocess.Popen(command, cwd=BACKEND_DIR, env=env,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                wait_for_port(port)
+                for slow in levels:
+                    result = asyncio.run(measure(port, slow, seconds))
+                    print(f"{label:<14} {slow:5d} slow clients  ok {result['ok']:6d}  failed {result['failed']:5d}  "
+                          f"p50 {result['p50_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms")
+            finally:
+                server.terminate()
+                server.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Worker cold-start time: import, create_app() and the first request
+
+Each sample runs in a fresh interpreter, the way a gunicorn worker or CLI
+invocation starts. The "init-db + seed at startup" row is what every process
+paid before the application factory, when main.py did it at import time.
+
+Usage: python benchmarks/cold_start.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {backend!r})
+import src.main
+imported = time.perf_counter()
+app = src.main.create_app()
+created = time.perf_counter()
+if {init!r}:
+    from src.commands import init_db, init_default_data
+    with app.app_context():
+        init_db()
+        init_default_data()
+initialized = time.perf_counter()
+app.test_client().get('/api/portfolio/personal-info')
+served = time.perf_counter()
+print(json.dumps({{
+    'import': imported - started,
+    'create_app': created - imported,
+    'init': initialized - created,
+    'first_request': served - initialized,
+    'total': served - started,
+}}))
+'''
+
+def sample(env, init):
+    code = PROBE.format(backend=BACKEND_DIR, init=init)
+    output = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def report(label, samples):
+    cells = '  '.join(
+        f'{key} {statistics.median(s[key] for s in samples) * 1000:7.1f} ms'
+        for key in ('import', 'create_app', 'init', 'first_request', 'total')
+    )
+    print(f'{label:<26} {cells}')
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'cold.db')}")
+        # Deploy-time setup, done once
+        sample(env, init=True)
+        
+        print(f'median of {runs} fresh interpreters')
+        report('factory (init-db once)', [sample(env, init=False) for _ in range(runs)])
+        report('init-db + seed at startup', [sample(env, init=True) for _ in range(runs)])
+
+if __name__ == '__main__':
+    main()
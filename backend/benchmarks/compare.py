@@ -0,0 +1,72 @@
+"""Compare two benchmarks/api.py result files and fail on regressions
+
+A route regresses when a compared metric (by default p50 latency and
+throughput; p99 is noisy on short runs) moves the wrong way by more than
+the threshold. Routes missing from either file are
+listed but don't fail the comparison.
+
+Usage: python benchmarks/compare.py <baseline.json> <current.json> [--threshold 0.15]
+                                    [--metrics p50_ms,p99_ms,rps]
+"""
+import argparse
+import json
+import sys
+
+# metric -> +1 if higher is worse, -1 if lower is worse
+METRICS = {'p50_ms': 1, 'p99_ms': 1, 'rps': -1}
+
+def compare(baseline, current, threshold, metrics=('p50_ms', 'rps')):
+    """Yield (mode, url, metric, old, new, change, regressed) for every shared route"""
+    for mode, routes in current['results'].items():
+        base_routes = baseline['results'].get(mode, {})
+        for url, result in routes.items():
+            base = base_routes.get(url)
+            if base is None:
+                yield mode, url, None, None, None, None, False
+                continue
+            for metric in metrics:
+                direction = METRICS[metric]
+                old, new = base.get(metric), result.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                yield mode, url, metric, old, new, change, change * direction > threshold
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='allowed relative change before a metric counts as a regression')
+    parser.add_argument('--metrics', default='p50_ms,rps',
+                        help=f"comma-separated subset of {', '.join(METRICS)}")
+    args = parser.parse_args()
+    metrics = args.metrics.split(',')
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        parser.error(f"unknown metrics: {', '.join(sorted(unknown))}")
+    
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    
+    for key in ('scale', 'concurrency', 'duration'):
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            print(f"warning: {key} differs ({baseline['meta'].get(key)} vs {current['meta'].get(key)})")
+    print(f"{baseline['meta'].get('commit')} -> {current['meta'].get('commit')}, threshold {args.threshold:.0%}")
+    
+    regressions = 0
+    for mode, url, metric, old, new, change, regressed in compare(baseline, current, args.threshold, metrics):
+        if metric is None:
+            print(f'{mode:<6} {url:<48} new route')
+            continue
+        regressions += regressed
+        marker = 'REGRESSION' if regressed else ''
+        print(f'{mode:<6} {url:<48} {metric:<7} {old:10.2f} -> {new:10.2f} {change:+8.1%} {marker}')
+    
+    print(f'{regressions} regression(s)')
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Sustained POST /api/portfolio/contact throughput: synchronous vs write-behind
+
+Usage: python benchmarks/contact_ingest.py [seconds] [threads]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.commands import init_db
+from src.main import create_app
+from src.models.portfolio import ContactMessage
+
+PAYLOAD = {
+    'name': 'Load Test',
+    'email': 'load@example.com',
+    'subject': 'Benchmark',
+    'message': 'Hello! ' * 80,
+}
+
+def run(app, seconds, threads):
+    stop = threading.Event()
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    
+    def client():
+        http = app.test_client()
+        while not stop.is_set():
+            started = time.perf_counter()
+            response = http.post('/api/portfolio/contact', json=PAYLOAD)
+            elapsed = time.perf_counter() - started
+            with lock:
+                (latencies if response.status_code in (200, 202) else failures).append(elapsed)
+    
+    workers = [threading.Thread(target=client) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    
+    drain_started = time.perf_counter()
+    contact_queue = app.extensions.get('contact_queue')
+    if contact_queue:
+        contact_queue.stop(timeout=60)
+    drain = time.perf_counter() - drain_started
+    
+    with app.app_context():
+        stored = ContactMessage.query.count()
+    latencies.sort()
+    return {
+        'accepted': len(latencies),
+        'failed': len(failures),
+        'stored': stored,
+        'rps': len(latencies) / seconds,
+        'p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0,
+        'drain_s': drain,
+    }
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    
+    print(f'{threads} client threads, {seconds:g}s per mode')
+    for label, write_behind in (('synchronous', False), ('write-behind', True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            app = create_app({
+                'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'ingest.db')}",
+                'CONTACT_WRITE_BEHIND': write_behind,
+                'CONTACT_SPOOL_DIR': os.path.join(tmp, 'spool'),
+                'RATELIMIT_ENABLED': False,
+            })
+            with app.app_context():
+                init_db()
+            result = run(app, seconds, threads)
+        print(f"{label:<13} {result['rps']:8.1f} req/s  p50 {result['p50_ms']:6.2f} ms  "
+              f"p99 {result['p99_ms']:7.2f} ms  accepted {result['accepted']}  stored {result['stored']}  "
+              f"failed {result['failed']}  drain {result['drain_s']:.2f}s")
+
+if __name__ == '__main__':
+    main()
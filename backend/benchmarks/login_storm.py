@@ -0,0 +1,107 @@
+"""Public-route latency during a login storm: inline hashing vs the bounded pool
+
+A threaded Werkzeug server takes wrong-password logins from many attacker
+threads while one client measures GET /api/portfolio/projects. "inline"
+verifies on the request thread, as login did before the pool; "pool" uses the
+configured PASSWORD_HASH_WORKERS/QUEUE and rejects the overflow with 503.
+
+Usage: python benchmarks/login_storm.py [seconds] [attacker threads]
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.serving import make_server
+
+from src.commands import init_db, init_default_data
+from src.main import create_app
+from src.services import passwords
+
+class InlineHasher(passwords.PasswordHasher):
+    """Verifies on the calling thread, with no bound"""
+    
+    def _run(self, fn, *args):
+        return fn(*args)
+
+def request(url, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+def run(app, seconds, attackers, storm):
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    stop = threading.Event()
+    login_codes = Counter()
+    
+    def attacker():
+        while not stop.is_set():
+            login_codes[request(f'{base}/api/admin/login', {'username': 'admin', 'password': 'wrong'})] += 1
+    
+    threads = [threading.Thread(target=attacker) for _ in range(attackers if storm else 0)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5 if storm else 0)
+    
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        request(f'{base}/api/portfolio/projects')
+        latencies.append(time.perf_counter() - started)
+    
+    stop.set()
+    for thread in threads:
+        thread.join()
+    server.shutdown()
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'logins': dict(login_codes),
+    }
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    attackers = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'storm.db')}",
+            'RATELIMIT_ENABLED': False,
+        })
+        with app.app_context():
+            init_db()
+            init_default_data()
+        
+        print(f'{os.cpu_count()} CPUs, {attackers} attacker threads, {seconds:g}s per run')
+        for label, hasher in (
+            ('inline', InlineHasher()),
+            ('pool', passwords.get_hasher(app)),
+        ):
+            app.extensions['password_hasher'] = hasher
+            for storm in (False, True):
+                result = run(app, seconds, attackers, storm)
+                logins = '  logins ' + ', '.join(f'{code}: {n}' for code, n in sorted(result['logins'].items())) if storm else ''
+                print(f"{label:<7} {'storm' if storm else 'idle':<6} public p50 {result['p50_ms']:8.2f} ms  "
+                      f"p99 {result['p99_ms']:8.2f} ms  ({result['requests']} requests){logins}")
+
+if __name__ == '__main__':
+    main()
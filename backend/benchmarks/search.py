@@ -0,0 +1,73 @@
+"""Message search latency: FTS5 MATCH with bm25 ranking vs a LIKE scan
+
+Usage: python benchmarks/search.py [messages] [repeats]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.commands import init_db
+from src.main import create_app
+from src.models.portfolio import db
+from src.services import search as search_service
+
+WORDS = (
+    'project website design budget timeline react flask python freelance contract meeting '
+    'portfolio mobile application backend frontend database deploy hosting review feedback '
+    'question collaboration startup product launch invoice schedule proposal consulting'
+).split()
+# Filler vocabulary so the named words above get realistic, skewed frequencies
+VOCABULARY = WORDS + [f'term{i}' for i in range(5000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+QUERIES = ('project', 'invoice schedule', 'term4000', 'term12 term40', 'kubernetes')
+
+def seed(count):
+    rng = random.Random(42)
+    rows = [
+        {
+            'name': f'Sender {i}',
+            'email': f'sender{i}@example.com',
+            'subject': ' '.join(rng.choices(VOCABULARY, WEIGHTS, k=4)),
+            'message': ' '.join(rng.choices(VOCABULARY, WEIGHTS, k=60)),
+            'is_read': False,
+        }
+        for i in range(count)
+    ]
+    connection = db.session.connection()
+    connection.execute(db.metadata.tables['contact_messages'].insert(), rows)
+    db.session.commit()
+
+def timed(query, repeats, use_fts):
+    search_service._available[str(db.engine.url)] = use_fts
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        hits = search_service.search('contact_messages_fts', query, 20)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000, len(hits)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'search.db')}"})
+        with app.app_context():
+            init_db()
+            started = time.perf_counter()
+            seed(count)
+            print(f'{count} messages indexed in {time.perf_counter() - started:.1f}s, median of {repeats} runs')
+            
+            for query in QUERIES:
+                fts_ms, fts_hits = timed(query, repeats, True)
+                like_ms, like_hits = timed(query, repeats, False)
+                print(f'{query!r:<26} fts5 {fts_ms:8.2f} ms ({fts_hits} hits)  '
+                      f'like {like_ms:8.2f} ms ({like_hits} hits)  {like_ms / fts_ms:6.1f}x')
+
+if __name__ == '__main__':
+    main()
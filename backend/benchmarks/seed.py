@@ -0,0 +1,116 @@
+"""Seed a SQLite database with synthetic portfolio data at a named scale
+
+Rows go in through Core executemany in chunks, so the FTS triggers still run
+but the ORM unit of work does not. Counters are recomputed at the end.
+
+Usage: python benchmarks/seed.py <scale> <database path>
+"""
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.commands import init_db, init_default_data
+from src.models.portfolio import (
+    db, Project, ProjectTechnology, ProjectFeature, Skill, Experience, Education, Language, ContactMessage
+)
+from src.services.stats import recount_stats
+
+# The public project, skill and experience routes are unpaginated, so those
+# stay bounded while messages (admin, keyset-paginated) grow to the full scale
+SCALES = {
+    '10': {'messages': 10, 'projects': 10, 'skills': 10, 'experience': 5},
+    '10k': {'messages': 10_000, 'projects': 10_000, 'skills': 200, 'experience': 50},
+    '1m': {'messages': 1_000_000, 'projects': 10_000, 'skills': 200, 'experience': 50},
+}
+
+CHUNK = 10_000
+TECHNOLOGIES = ('React', 'Flask', 'Python', 'SQLite', 'TypeScript', 'Docker', 'Redis', 'Tailwind CSS', 'Node.js')
+WORDS = ('fast', 'responsive', 'modern', 'secure', 'scalable', 'portfolio', 'store', 'dashboard',
+         'analytics', 'booking', 'platform', 'agency', 'mobile', 'design', 'backend', 'frontend')
+
+def _text(rng, words):
+    return ' '.join(rng.choices(WORDS, k=words))
+
+def _insert(model, rows):
+    connection = db.session.connection()
+    for start in range(0, len(rows), CHUNK):
+        connection.execute(model.__table__.insert(), rows[start:start + CHUNK])
+
+def _insert_projects(rng, count, now):
+    for start in range(0, count, CHUNK):
+        batch = range(start, min(start + CHUNK, count))
+        first_id = (db.session.query(db.func.max(Project.id)).scalar() or 0) + 1
+        projects, technologies, features = [], [], []
+        for offset, i in enumerate(batch):
+            project_id = first_id + offset
+            tech = rng.sample(TECHNOLOGIES, 3)
+            feats = [_text(rng, 3) for _ in range(3)]
+            created = now - timedelta(minutes=i)
+            projects.append({
+                'id': project_id, 'title': f'Project {i}', 'subtitle': _text(rng, 3),
+                'description': _text(rng, 25), 'long_description': _text(rng, 80),
+                'technologies': json.dumps(tech), 'features': json.dumps(feats),
+                'status': 'Live', 'is_featured': rng.random() < 0.1, 'order_index': rng.randrange(100),
+                'created_at': created, 'updated_at': created,
+            })
+            technologies.extend({'project_id': project_id, 'name': name, 'position': p} for p, name in enumerate(tech))
+            features.extend({'project_id': project_id, 'name': name, 'position': p} for p, name in enumerate(feats))
+        _insert(Project, projects)
+        _insert(ProjectTechnology, technologies)
+        _insert(ProjectFeature, features)
+
+def seed(scale, seed=42):
+    """Add synthetic rows on top of the default data; call inside an app context"""
+    counts = SCALES[scale]
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    
+    init_db()
+    init_default_data()
+    
+    _insert_projects(rng, counts['projects'], now)
+    _insert(Skill, [
+        {'name': f'Skill {i}', 'category': rng.choice(('Frontend', 'Backend', 'Tools')),
+         'level': rng.randrange(40, 100), 'description': _text(rng, 8), 'order_index': i,
+         'created_at': now, 'updated_at': now}
+        for i in range(counts['skills'])
+    ])
+    _insert(Experience, [
+        {'title': f'Role {i}', 'company': f'Company {i}', 'period': '2020 - 2022', 'location': 'Remote',
+         'description': _text(rng, 30), 'responsibilities': json.dumps([_text(rng, 6) for _ in range(3)]),
+         'projects': json.dumps([]), 'order_index': i, 'created_at': now, 'updated_at': now}
+        for i in range(counts['experience'])
+    ])
+    _insert(Education, [{'degree': 'BSc', 'field': 'Computer Science', 'institution': 'University',
+                         'period': '2015 - 2019', 'order_index': 0, 'created_at': now, 'updated_at': now}])
+    _insert(Language, [{'name': 'English', 'level': 'Fluent', 'order_index': 0, 'created_at': now, 'updated_at': now}])
+    
+    for start in range(0, counts['messages'], CHUNK):
+        _insert(ContactMessage, [
+            {'name': f'Sender {i}', 'email': f'sender{i % 5000}@example.com', 'subject': _text(rng, 4),
+             'message': _text(rng, 60), 'is_read': rng.random() < 0.7,
+             'created_at': now - timedelta(seconds=i)}
+            for i in range(start, min(start + CHUNK, counts['messages']))
+        ])
+    db.session.commit()
+    recount_stats()
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in SCALES:
+        sys.exit(f"Usage: python benchmarks/seed.py <{'|'.join(SCALES)}> <database path>")
+    scale, path = sys.argv[1], os.path.abspath(sys.argv[2])
+    
+    from src.main import create_app
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}', 'METRICS_SLOW_QUERY_MS': None})
+    started = time.perf_counter()
+    with app.app_context():
+        seed(scale)
+    print(f'Seeded {scale} into {path} in {time.perf_counter() - started:.1f}s')
+
+if __name__ == '__main__':
+    main()
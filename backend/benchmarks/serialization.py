@@ -0,0 +1,86 @@
+"""Per-row serialization cost of the project listing, before and after the schema layer
+
+Usage: python benchmarks/serialization.py [rows]
+"""
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from src.models.portfolio import Project
+from src.services.serializers import admin_project_schema, init_json, project_schema
+
+def make_projects(count):
+    projects = []
+    for i in range(count):
+        project = Project(
+            id=i,
+            title=f'Project {i}',
+            subtitle='E-commerce Platform',
+            description='A robust e-commerce platform with modern React frontend.',
+            long_description='Engineered a full-stack e-commerce solution. ' * 8,
+            image_url=f'/images/project-{i}.webp',
+            live_url='https://example.com',
+            github_url='#',
+            status='Live',
+            is_featured=i % 3 == 0,
+            order_index=i,
+            created_at=datetime(2025, 1, 1)
+        )
+        project.technologies = json.dumps(['React.js', 'Flask', 'SQLAlchemy', 'Python', 'REST API'])
+        project.features = json.dumps(['Modern React.js frontend', 'RESTful API architecture', 'Comprehensive admin panel'])
+        projects.append(project)
+    return projects
+
+def legacy_rows(projects):
+    # The hand-built dicts the routes used before, including json.loads per row
+    return [{
+        'id': p.id,
+        'title': p.title,
+        'subtitle': p.subtitle,
+        'description': p.description,
+        'long_description': p.long_description,
+        'technologies': json.loads(p.technologies),
+        'features': json.loads(p.features),
+        'image_url': p.image_url,
+        'live_url': p.live_url,
+        'github_url': p.github_url,
+        'status': p.status,
+        'is_featured': p.is_featured
+    } for p in projects]
+
+def forget_decoded(projects):
+    # Each request loads fresh instances, so don't let the memoized lists carry over
+    for project in projects:
+        project.__dict__.pop('_technology_list_cache', None)
+        project.__dict__.pop('_feature_list_cache', None)
+
+def measure(label, fn, rows, repeat=5, setup=lambda: None):
+    best = min(timeit.repeat(fn, setup=setup, number=1, repeat=repeat))
+    print(f'{label:<42} {best * 1000:8.2f} ms  {best / rows * 1e6:7.2f} us/row')
+    return best
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    projects = make_projects(rows)
+    
+    stdlib_app = Flask('stdlib')
+    fast_app = Flask('fast')
+    init_json(fast_app)
+    fresh = lambda: forget_decoded(projects)
+    
+    print(f'{rows} projects, best of 5')
+    before = measure('before: dict comprehension + json', lambda: stdlib_app.json.dumps(legacy_rows(projects)), rows)
+    measure('schema (public view) only', lambda: project_schema.dump_many(projects), rows, setup=fresh)
+    measure('schema (admin view) only', lambda: admin_project_schema.dump_many(projects), rows, setup=fresh)
+    measure('schema + stdlib json', lambda: stdlib_app.json.dumps(project_schema.dump_many(projects)), rows, setup=fresh)
+    after = measure(f'after: schema + {type(fast_app.json).__name__}',
+                    lambda: fast_app.json.dumps(project_schema.dump_many(projects)), rows, setup=fresh)
+    print(f'speedup: {before / after:.2f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Read throughput while writes are in progress, per SQLite profile
+
+Usage: python benchmarks/sqlite_concurrency.py [seconds] [readers] [writers]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+from src.models.portfolio import db, ContactMessage, Project
+from src.services.sqlite_profile import configure_sqlite_engine, init_sqlite_pragmas
+
+def make_app(path, profile):
+    app = Flask(profile)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLITE_PROFILE'] = profile
+    configure_sqlite_engine(app)
+    db.init_app(app)
+    init_sqlite_pragmas(app, db)
+    with app.app_context():
+        db.create_all()
+        for i in range(200):
+            db.session.add(Project(title=f'Project {i}', description='Benchmark project ' * 10, order_index=i))
+        db.session.commit()
+    return app
+
+def run(app, seconds, readers, writers):
+    stop = threading.Event()
+    counts = {'reads': 0, 'writes': 0, 'locked': 0}
+    latencies = []
+    lock = threading.Lock()
+    
+    def reader():
+        with app.app_context():
+            while not stop.is_set():
+                started = time.perf_counter()
+                Project.query.order_by(Project.order_index).all()
+                db.session.rollback()
+                elapsed = time.perf_counter() - started
+                with lock:
+                    counts['reads'] += 1
+                    latencies.append(elapsed)
+    
+    def writer():
+        with app.app_context():
+            while not stop.is_set():
+                try:
+                    db.session.add(ContactMessage(name='Bench', email='bench@example.com',
+                                                  subject='Load', message='x' * 500))
+                    db.session.commit()
+                    key = 'writes'
+                except OperationalError:
+                    db.session.rollback()
+                    key = 'locked'
+                with lock:
+                    counts[key] += 1
+    
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0
+    return counts, p99
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    
+    print(f'{readers} readers, {writers} writers, {seconds:g}s per profile')
+    for profile in ('default', 'production'):
+        with tempfile.TemporaryDirectory() as tmp:
+            app = make_app(os.path.join(tmp, 'bench.db'), profile)
+            counts, p99 = run(app, seconds, readers, writers)
+            with app.app_context():
+                db.engine.dispose()
+        print(f"{profile:<11} reads/s {counts['reads'] / seconds:9.1f}  read p99 {p99:7.2f} ms  "
+              f"writes/s {counts['writes'] / seconds:8.1f}  locked errors {counts['locked']}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""Optional ASGI entry point: async public reads, everything else via the Flask app
+
+Run with e.g. ``uvicorn src.asgi:app --workers 2`` after installing
+requirements-asgi.txt. The public portfolio GET routes are served by async
+handlers on aiosqlite, so slow clients hold a coroutine instead of a worker
+thread; admin, contact and every other route go to the unchanged WSGI app.
+"""
+import os
+import sys
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from a2wsgi import WSGIMiddleware
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.main import create_app
+from src.models.portfolio import PersonalInfo, Project, Skill, Experience, Education, Language
+from src.routes.portfolio import (
+    education_query, experience_query, languages_query, personal_info_query, projects_query,
+    render_personal_info, render_skills, skills_query
+)
+from src.services.cache import CONTENT_MODELS, content_version, response_cache
+from src.services.conditional import compute_validators, resource_state_statement, state_pairs
+from src.services.serializers import (
+    education_schema, experience_schema, language_schema, project_schema
+)
+from src.services.sqlite_profile import attach_pragmas, profile_pragmas
+
+class NotFound(Exception):
+    pass
+
+async def _personal_info(session, request):
+    return render_personal_info((await session.scalars(personal_info_query())).first())
+
+async def _projects(session, request):
+    featured_only = request.query_params.get('featured', 'false').lower() == 'true'
+    tech = request.query_params.get('tech')
+    return project_schema.dump_many((await session.scalars(projects_query(featured_only, tech))).all())
+
+async def _project(session, request):
+    project = await session.get(Project, request.path_params['project_id'])
+    if project is None:
+        raise NotFound('Project not found')
+    return project_schema.dump(project)
+
+async def _skills(session, request):
+    return render_skills((await session.scalars(skills_query())).all())
+
+async def _experience(session, request):
+    return experience_schema.dump_many((await session.scalars(experience_query())).all())
+
+async def _education(session, request):
+    return education_schema.dump_many((await session.scalars(education_query())).all())
+
+async def _languages(session, request):
+    return language_schema.dump_many((await session.scalars(languages_query())).all())
+
+async def _bundle(session, request):
+    return {
+        'personal_info': await _personal_info(session, request),
+        'projects': project_schema.dump_many((await session.scalars(projects_query())).all()),
+        'skills': await _skills(session, request),
+        'experience': await _experience(session, request),
+        'education': await _education(session, request),
+        'languages': await _languages(session, request),
+    }
+
+# path -> (loader, models whose state validates the response, criteria from path params)
+PUBLIC_READS = {
+    '/api/portfolio/bundle': (_bundle, CONTENT_MODELS, None),
+    '/api/portfolio/personal-info': (_personal_info, (PersonalInfo,), None),
+    '/api/portfolio/projects': (_projects, (Project,), None),
+    '/api/portfolio/projects/{project_id:int}': (_project, (Project,), lambda project_id: [Project.id == project_id]),
+    '/api/portfolio/skills': (_skills, (Skill,), None),
+    '/api/portfolio/experience': (_experience, (Experience,), None),
+    '/api/portfolio/education': (_education, (Education,), None),
+    '/api/portfolio/languages': (_languages, (Language,), None),
+}
+
+def _async_url(uri):
+    if not uri.startswith('sqlite:'):
+        raise ValueError('The ASGI read path supports SQLite databases only')
+    return 'sqlite+aiosqlite:' + uri[len('sqlite:'):]
+
+def _not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match:
+        return if_none_match.strip() == '*' or any(
+            tag.strip().removeprefix('W/').strip('"') == etag for tag in if_none_match.split(','))
+    if_modified_since = request.headers.get('if-modified-since')
+    if last_modified and if_modified_since:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def _cors_headers(request):
+    # Mirrors CORS(app, supports_credentials=True) on the Flask side
+    origin = request.headers.get('origin')
+    if not origin:
+        return {}
+    return {'Access-Control-Allow-Origin': origin, 'Access-Control-Allow-Credentials': 'true', 'Vary': 'Origin'}
+
+def create_asgi_app(flask_app=None):
+    """Wrap the Flask app, taking over its public GET routes with async handlers"""
+    flask_app = flask_app or create_app()
+    reader = flask_app.extensions.get('replication_reader')
+    engine_options = {}
+    if reader is not None:
+        import aiosqlite
+        
+        async def connect():
+            # Like the WSGI side, each new connection opens whichever snapshot is current
+            return await aiosqlite.connect(reader.uri(), uri=True, check_same_thread=False)
+        engine_options['async_creator'] = connect
+    engine = create_async_engine(_async_url(flask_app.config['SQLALCHEMY_DATABASE_URI']), **engine_options)
+    attach_pragmas(engine.sync_engine, profile_pragmas(flask_app))
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    
+    snapshot = [reader.path if reader else None]
+    
+    async def follow_snapshot():
+        # Replicas poll for new snapshots; drop pooled connections to the old one
+        reader.start()
+        if reader.path != snapshot[0]:
+            snapshot[0] = reader.path
+            await engine.dispose()
+    
+    def endpoint(loader, models, where):
+        async def handle(request):
+            try:
+                if reader is not None:
+                    await follow_snapshot()
+                criteria = where(**request.path_params) if where else ()
+                async with Session() as session:
+                    state = state_pairs((await session.execute(resource_state_statement(models, criteria))).one())
+                    args = sorted(request.query_params.multi_items())
+                    etag, last_modified = compute_validators(request.url.path, args, state, where is not None)
+                    headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache', **_cors_headers(request)}
+                    if last_modified:
+                        headers['Last-Modified'] = last_modified.strftime('%a, %d %b %Y %H:%M:%S GMT')
+                    if _not_modified(request, etag, last_modified):
+                        return Response(status_code=304, headers=headers)
+                    
+                    # Same key and tag as cached_response, so both paths share entries
+                    key = (request.url.path, tuple(args))
+                    version = (content_version(), etag)
+                    hit = response_cache.get(key, version)
+                    if hit is None:
+                        data = await loader(session, request)
+                        body = flask_app.json.response({'success': True, 'data': data}).get_data()
+                        hit = (body, 'application/json')
+                        response_cache.set(key, version, hit)
+                return Response(hit[0], media_type=hit[1], headers=headers)
+            
+            except NotFound as e:
+                body = flask_app.json.response({'success': False, 'message': str(e)}).get_data()
+                return Response(body, status_code=404, media_type='application/json')
+            
+            except Exception as e:
+                body = flask_app.json.response({'success': False, 'message': str(e)}).get_data()
+                return Response(body, status_code=500, media_type='application/json')
+        return handle
+    
+    routes = [Route(path, endpoint(*spec), methods=['GET']) for path, spec in PUBLIC_READS.items()]
+    routes.append(Mount('/', app=WSGIMiddleware(flask_app)))
+    
+    @asynccontextmanager
+    async def lifespan(asgi_app):
+        yield
+        await engine.dispose()
+    
+    asgi_app = Starlette(routes=routes, lifespan=lifespan)
+    asgi_app.state.flask_app = flask_app
+    return asgi_app
+
+def __getattr__(name):
+    # `uvicorn src.asgi:app`, built on first access like src.main:app
+    if name == 'app':
+        global app
+        app = create_asgi_app()
+        return app
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
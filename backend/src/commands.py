@@ -0,0 +1,219 @@
+import os
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from werkzeug.security import generate_password_hash
+from src.models.portfolio import (
+    db, AdminUser, PersonalInfo, Project, ProjectTechnology, ProjectFeature, Skill, Language
+)
+from src.services.query_audit import audit_queries, format_report
+from src.services.replication import publish_snapshot
+from src.services.search import init_search
+from src.services.stats import recount_stats
+from src.services.static_export import export_static
+from src.services.static_files import compress_static
+
+def init_default_data():
+    """Initialize default data for the portfolio"""
+    
+    # Create default admin user
+    if not AdminUser.query.filter_by(username='admin').first():
+        admin = AdminUser(
+            username='admin',
+            password_hash=generate_password_hash('admin123'),
+            email='admin@mahmoudglala.com',
+            is_active=True
+        )
+        db.session.add(admin)
+    
+    # Create default personal info
+    if not PersonalInfo.query.first():
+        personal_info = PersonalInfo(
+            name='Mahmoud Glala',
+            title='Full Stack Developer & UI/UX Enthusiast',
+            email='mahmoud.glala@example.com',
+            phone='+20 123 456 7890',
+            location='Egypt',
+            summary='Highly motivated and results-oriented Full Stack Developer with a strong passion for creating innovative and user-centric web applications. Proficient in both frontend and backend technologies, with a keen eye for creative UI/UX design and a commitment to delivering high-quality, scalable solutions. Adept at working under pressure and leveraging AI tools to enhance productivity and stay abreast of market trends.'
+        )
+        db.session.add(personal_info)
+    
+    # Create default projects
+    if not Project.query.first():
+        projects = [
+            {
+                'title': 'Roo Florals',
+                'subtitle': 'Online Flower Shop',
+                'description': 'A comprehensive e-commerce platform for a flower shop featuring product catalog, shopping cart, order management, and admin panel.',
+                'long_description': 'Developed a beautiful and modern online flower shop with complete e-commerce functionality. The platform includes a responsive product catalog, shopping cart with quantity management, secure checkout process, and comprehensive admin panel for managing products, orders, and settings. Features include coupon system, branch management, contact forms, and Telegram integration for order notifications.',
+                'technologies': ['Flask', 'Python', 'SQLite', 'HTML5', 'CSS3', 'JavaScript', 'Telegram Bot API'],
+                'features': ['Product catalog with search and filtering', 'Shopping cart and checkout system', 'Admin panel for content management', 'Order tracking and management', 'Telegram bot integration', 'Coupon and discount system', 'Branch management', 'Responsive design'],
+                'live_url': 'https://rooflorals.com',
+                'github_url': '#',
+                'status': 'Live',
+                'is_featured': True,
+                'order_index': 1
+            },
+            {
+                'title': 'MG Store',
+                'subtitle': 'E-commerce Platform',
+                'description': 'A robust e-commerce platform with modern React frontend, Flask backend, and comprehensive admin panel.',
+                'long_description': 'Engineered a full-stack e-commerce solution with a modern React.js frontend and robust Flask backend. The platform features comprehensive API endpoints for products, categories, orders, authentication, and payment processing. Implemented advanced security measures including CSRF protection, rate limiting, and secure logging. The admin panel provides rich UI for managing all aspects of the store.',
+                'technologies': ['React.js', 'Flask', 'SQLAlchemy', 'Python', 'REST API', 'CSRF Protection', 'Rate Limiting'],
+                'features': ['Modern React.js frontend', 'RESTful API architecture', 'Advanced security measures', 'Rate limiting and CSRF protection', 'Comprehensive admin panel', 'Payment processing integration', 'User authentication system', 'Scalable database design'],
+                'live_url': '#',
+                'github_url': '#',
+                'status': 'In Development',
+                'is_featured': True,
+                'order_index': 2
+            },
+            {
+                'title': 'Nexus Agency',
+                'subtitle': 'Agency Website',
+                'description': 'A modern agency website showcasing services, portfolio, and team.',
+                'long_description': 'Created a sophisticated agency website that effectively showcases the company\'s services, portfolio, and team. The site features modern design principles, smooth animations, and optimized performance. Implemented SEO best practices and ensured excellent user experience across all devices.',
+                'technologies': ['React.js', 'Tailwind CSS', 'Framer Motion', 'Next.js', 'SEO Optimization'],
+                'features': ['Modern responsive design', 'Smooth animations and transitions', 'SEO optimized', 'Performance optimized', 'Portfolio showcase', 'Contact forms', 'Team profiles', 'Service pages'],
+                'live_url': 'https://nexusagencyeg.com',
+                'github_url': '#',
+                'status': 'Live',
+                'is_featured': True,
+                'order_index': 3
+            }
+        ]
+        
+        for project_data in projects:
+            project = Project(**{k: v for k, v in project_data.items() if k not in ['technologies', 'features']})
+            project.set_technologies(project_data['technologies'])
+            project.set_features(project_data['features'])
+            db.session.add(project)
+    
+    # Create default skills
+    if not Skill.query.first():
+        skills = [
+            {'name': 'Python', 'category': 'Backend', 'level': 90},
+            {'name': 'Flask', 'category': 'Backend', 'level': 85},
+            {'name': 'JavaScript', 'category': 'Frontend', 'level': 88},
+            {'name': 'React.js', 'category': 'Frontend', 'level': 85},
+            {'name': 'HTML5', 'category': 'Frontend', 'level': 95},
+            {'name': 'CSS3', 'category': 'Frontend', 'level': 90},
+            {'name': 'SQLite', 'category': 'Database', 'level': 80},
+            {'name': 'SQLAlchemy', 'category': 'Database', 'level': 75},
+            {'name': 'REST APIs', 'category': 'Backend', 'level': 85},
+            {'name': 'Git', 'category': 'Tools', 'level': 80},
+            {'name': 'UI/UX Design', 'category': 'Design', 'level': 85}
+        ]
+        
+        for skill_data in skills:
+            skill = Skill(**skill_data)
+            db.session.add(skill)
+    
+    # Create default languages
+    if not Language.query.first():
+        languages = [
+            {'name': 'Arabic', 'level': 'Native', 'order_index': 1},
+            {'name': 'English', 'level': 'Fluent', 'order_index': 2}
+        ]
+        
+        for lang_data in languages:
+            language = Language(**lang_data)
+            db.session.add(language)
+    
+    db.session.commit()
+
+def migrate_project_tags():
+    """Backfill project_technologies/project_features from the JSON columns"""
+    
+    has_technologies = {row[0] for row in db.session.query(ProjectTechnology.project_id).distinct()}
+    has_features = {row[0] for row in db.session.query(ProjectFeature.project_id).distinct()}
+    
+    for project in Project.query.all():
+        if project.id not in has_technologies:
+            for i, name in enumerate(project.get_technologies()):
+                db.session.add(ProjectTechnology(project_id=project.id, name=name, position=i))
+        if project.id not in has_features:
+            for i, name in enumerate(project.get_features()):
+                db.session.add(ProjectFeature(project_id=project.id, name=name, position=i))
+    
+    db.session.commit()
+
+def ensure_indexes():
+    """Create indexes added to the models after their tables already existed"""
+    
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+def init_db():
+    """Create tables and indexes and bring derived tables up to date"""
+    
+    db.create_all()
+    ensure_indexes()
+    migrate_project_tags()
+    recount_stats()
+    init_search()
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create the database schema. Run once per deploy."""
+    init_db()
+    click.echo('Database initialized.')
+
+@click.command('seed')
+@with_appcontext
+def seed_command():
+    """Insert the default admin user and portfolio content if missing."""
+    init_default_data()
+    migrate_project_tags()
+    recount_stats()
+    click.echo('Default data seeded.')
+
+@click.command('audit-queries')
+@click.option('--json', 'as_json', is_flag=True, help='Print the report as JSON.')
+@click.option('--strict', is_flag=True, help='Exit with status 1 if any full table scan is found.')
+@with_appcontext
+def audit_queries_command(as_json, strict):
+    """EXPLAIN every query issued by the API blueprints and report full table scans."""
+    results = audit_queries(current_app._get_current_object())
+    click.echo(format_report(results, as_json))
+    if strict and any(scans for _, _, _, scans in results):
+        raise SystemExit(1)
+
+@click.command('compress-static')
+@click.option('--min-size', default=1024, show_default=True, help='Skip files smaller than this many bytes.')
+@with_appcontext
+def compress_static_command(min_size):
+    """Precompress text assets in the static folder (.gz, and .br if brotli is installed)."""
+    written = compress_static(current_app.static_folder, min_size=min_size)
+    for path, size, compressed in written:
+        click.echo(f'{path}: {size} -> {compressed} bytes')
+    click.echo(f'{len(written)} compressed files written.')
+
+@click.command('export-static')
+@click.option('--out', type=click.Path(file_okay=False), help='Output directory [default: STATIC_EXPORT_DIR or the static folder].')
+@with_appcontext
+def export_static_command(out):
+    """Prerender the public API to precompressed JSON files with an integrity manifest."""
+    out = out or current_app.config['STATIC_EXPORT_DIR'] or current_app.static_folder
+    files = export_static(current_app._get_current_object(), out)
+    click.echo(f'{len(files)} files written to {os.path.join(out, "api", "portfolio")}.')
+
+@click.command('publish-snapshot')
+@click.option('--dir', 'directory', type=click.Path(file_okay=False), help='Snapshot directory [default: REPLICATION_DIR].')
+@with_appcontext
+def publish_snapshot_command(directory):
+    """Publish a consistent copy of the database for read replicas."""
+    directory = directory or current_app.config['REPLICATION_DIR']
+    if not directory:
+        raise click.UsageError('Pass --dir or set REPLICATION_DIR.')
+    path = publish_snapshot(current_app._get_current_object(), directory, current_app.config['REPLICATION_KEEP'])
+    click.echo(f'Published {path}')
+
+def register_commands(app):
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(seed_command)
+    app.cli.add_command(audit_queries_command)
+    app.cli.add_command(compress_static_command)
+    app.cli.add_command(export_static_command)
+    app.cli.add_command(publish_snapshot_command)
@@ -0,0 +1,85 @@
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'asdf#FGSgvasgf$5$WGT')
+    
+    # Database configuration
+    SQLALCHEMY_DATABASE_URI = os.environ.get(
+        'DATABASE_URL', f"sqlite:///{os.path.join(BASE_DIR, 'database', 'app.db')}"
+    )
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'production')
+    
+    # Public response cache and JSON encoding
+    RESPONSE_CACHE_MAX_ENTRIES = 256
+    JSON_USE_ORJSON = True
+    
+    # Cache lifetime for static files without a content hash in their name
+    STATIC_MAX_AGE = 3600
+    
+    # flask export-static output (defaults to the static folder) and whether
+    # content commits re-export it in the background
+    STATIC_EXPORT_DIR = os.environ.get('STATIC_EXPORT_DIR')
+    STATIC_EXPORT_ON_CHANGE = os.environ.get('STATIC_EXPORT_ON_CHANGE', '').lower() in ('1', 'true', 'yes')
+    
+    # Responsive image derivatives (/api/portfolio/images/<name>)
+    IMAGE_SOURCE_DIR = None  # defaults to <static folder>/images
+    IMAGE_CACHE_DIR = os.environ.get('IMAGE_CACHE_DIR', os.path.join(BASE_DIR, 'cache', 'images'))
+    IMAGE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+    IMAGE_WIDTHS = (320, 640, 960, 1280, 1920)
+    IMAGE_QUALITY = 80
+    IMAGE_WORKERS = 2
+    IMAGE_RENDER_TIMEOUT = 30
+    IMAGE_MAX_AGE = 24 * 3600
+    
+    # Write-behind ingestion of contact form submissions
+    CONTACT_WRITE_BEHIND = True
+    CONTACT_SPOOL_DIR = os.environ.get('CONTACT_SPOOL_DIR', os.path.join(BASE_DIR, 'database', 'spool'))
+    CONTACT_BATCH_SIZE = 100
+    CONTACT_FLUSH_INTERVAL = 0.5
+    CONTACT_SPOOL_FSYNC = True
+    
+    # Token-bucket limits as (burst capacity, refill period in seconds)
+    RATELIMIT_ENABLED = True
+    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL', 'memory://')
+    RATELIMIT_RULES = {
+        'contact_ip': (5, 600),
+        'login_ip': (10, 300),
+        'login_username': (5, 300),
+    }
+    
+    # Admin identity: cached lookups, and optional stateless bearer tokens
+    # (returned by /api/admin/login) as an alternative to the session cookie
+    AUTH_PRINCIPAL_TTL = 30
+    AUTH_TOKENS_ENABLED = os.environ.get('AUTH_TOKENS_ENABLED', '').lower() in ('1', 'true', 'yes')
+    AUTH_TOKEN_MAX_AGE = 3600
+    
+    # Password hashing for admin login runs on a small dedicated pool; logins
+    # beyond workers + queue get 503 instead of tying up request workers
+    PASSWORD_HASH_WORKERS = 2
+    PASSWORD_HASH_QUEUE = 8
+    PASSWORD_HASH_TIMEOUT = 10
+    PASSWORD_HASH_METHOD = 'scrypt'
+    
+    # Snapshot replication: the primary publishes backups of the database to
+    # REPLICATION_DIR after content commits; replicas serve portfolio reads
+    # from the newest one and forward everything else to PRIMARY_URL
+    REPLICATION_ROLE = os.environ.get('REPLICATION_ROLE')  # None, 'primary' or 'replica'
+    REPLICATION_DIR = os.environ.get('REPLICATION_DIR')
+    REPLICATION_KEEP = 3
+    REPLICATION_SCRUB_TABLES = ('contact_messages', 'contact_spool_acks', 'admin_users')
+    REPLICATION_POLL_INTERVAL = 5
+    PRIMARY_URL = os.environ.get('PRIMARY_URL')
+    PRIMARY_TIMEOUT = 10
+    
+    # Number of trusted proxies (replicas, load balancers) in X-Forwarded-For
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
+    
+    # Request timing, SQL counts and the Prometheus endpoint at /metrics
+    # (served only when METRICS_TOKEN is set)
+    METRICS_ENABLED = True
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    METRICS_SLOW_QUERY_MS = 100
+    METRICS_SERVER_TIMING = True
@@ -1,8 +1,63 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 import json
+import logging
 
 db = SQLAlchemy()
+logger = logging.getLogger(__name__)
+
+class JSONList:
+    """Decoded view of a JSON text column holding a list
+    
+    The column is parsed once per loaded value and the list is cached on the
+    instance until the column changes (assignment, refresh or expiry). Values
+    are validated on write. The cached list is shared, so treat it as read-only.
+    """
+    
+    def __init__(self, column, item_type=str):
+        self.column = column
+        self.item_type = item_type
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.cache_key = f'_{name}_cache'
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        raw = getattr(instance, self.column)
+        cached = instance.__dict__.get(self.cache_key)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        value = self.decode(instance, raw)
+        instance.__dict__[self.cache_key] = (raw, value)
+        return value
+    
+    def __set__(self, instance, value):
+        value = self.validate(value)
+        raw = json.dumps(value)
+        setattr(instance, self.column, raw)
+        instance.__dict__[self.cache_key] = (raw, value)
+    
+    def decode(self, instance, raw):
+        if not raw:
+            return []
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            logger.warning('Malformed JSON in %s.%s (id=%s)', type(instance).__name__, self.column, instance.id)
+            return []
+        if not isinstance(value, list):
+            logger.warning('Non-list JSON in %s.%s (id=%s)', type(instance).__name__, self.column, instance.id)
+            return []
+        return value
+    
+    def validate(self, value):
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f'{self.column} must be a list')
+        if self.item_type and not all(isinstance(item, self.item_type) for item in value):
+            raise ValueError(f'{self.column} must be a list of {self.item_type.__name__} values')
+        return list(value)
 
 class PersonalInfo(db.Model):
     __tablename__ = 'personal_info'
@@ -30,29 +85,24 @@ class Experience(db.Model):
     projects = db.Column(db.Text)  # JSON string
     order_index = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    
+    responsibility_list = JSONList('responsibilities')
+    project_list = JSONList('projects', item_type=None)
     
     def get_responsibilities(self):
-        if self.responsibilities:
-            try:
-                return json.loads(self.responsibilities)
-            except:
-                return []
-        return []
+        return self.responsibility_list
     
     def set_responsibilities(self, responsibilities_list):
-        self.responsibilities = json.dumps(responsibilities_list)
+        self.responsibility_list = responsibilities_list
     
     def get_projects(self):
-        if self.projects:
-            try:
-                return json.loads(self.projects)
-            except:
-                return []
-        return []
+        return self.project_list
     
     def set_projects(self, projects_list):
-        self.projects = json.dumps(projects_list)
+        self.project_list = projects_list
+
+db.Index('ix_experience_order_index_created_at', Experience.order_index, Experience.created_at.desc())
 
 class Project(db.Model):
     __tablename__ = 'projects'
@@ -71,32 +121,61 @@ class Project(db.Model):
     is_featured = db.Column(db.Boolean, default=False)
     order_index = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    
+    # Normalized copies of the JSON columns, used for filtering
+    technology_rows = db.relationship('ProjectTechnology', order_by='ProjectTechnology.position',
+                                      cascade='all, delete-orphan')
+    feature_rows = db.relationship('ProjectFeature', order_by='ProjectFeature.position',
+                                   cascade='all, delete-orphan')
+    
+    technology_list = JSONList('technologies')
+    feature_list = JSONList('features')
     
     def get_technologies(self):
-        if self.technologies:
-            try:
-                return json.loads(self.technologies)
-            except:
-                return []
-        return []
+        return self.technology_list
     
     def set_technologies(self, tech_list):
-        self.technologies = json.dumps(tech_list)
+        self.technology_list = tech_list
+        self.technology_rows = [ProjectTechnology(name=name, position=i) for i, name in enumerate(self.technology_list)]
     
     def get_features(self):
-        if self.features:
-            try:
-                return json.loads(self.features)
-            except:
-                return []
-        return []
+        return self.feature_list
     
     def set_features(self, features_list):
-        self.features = json.dumps(features_list)
+        self.feature_list = features_list
+        self.feature_rows = [ProjectFeature(name=name, position=i) for i, name in enumerate(self.feature_list)]
+
+# Public and admin listing order, also the keyset pagination order
+db.Index('ix_projects_order_index_created_at_id', Project.order_index, Project.created_at.desc(), Project.id.desc())
+# ?featured=true listing
+db.Index('ix_projects_is_featured_order_index', Project.is_featured, Project.order_index)
+
+class ProjectTechnology(db.Model):
+    __tablename__ = 'project_technologies'
+    __table_args__ = (
+        # Serves ?tech= lookups without touching the projects table
+        db.Index('ix_project_technologies_name_project_id', 'name', 'project_id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False, index=True)
+    name = db.Column(db.String(100, collation='NOCASE'), nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)
+
+class ProjectFeature(db.Model):
+    __tablename__ = 'project_features'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False, index=True)
+    name = db.Column(db.String(255), nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)
 
 class Skill(db.Model):
     __tablename__ = 'skills'
+    __table_args__ = (
+        db.Index('ix_skills_category_order_index', 'category', 'order_index'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -105,7 +184,7 @@ class Skill(db.Model):
     description = db.Column(db.Text)
     order_index = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 class Education(db.Model):
     __tablename__ = 'education'
@@ -118,20 +197,33 @@ class Education(db.Model):
     description = db.Column(db.Text)
     order_index = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+db.Index('ix_education_order_index_created_at', Education.order_index, Education.created_at.desc())
 
 class Language(db.Model):
     __tablename__ = 'languages'
+    __table_args__ = (
+        db.Index('ix_languages_order_index', 'order_index'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False)
     level = db.Column(db.String(50), nullable=False)  # Native, Fluent, Intermediate, Basic
     order_index = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 class ContactMessage(db.Model):
     __tablename__ = 'contact_messages'
+    __table_args__ = (
+        # Keyset pagination order for the admin inbox
+        db.Index('ix_contact_messages_created_at_id', 'created_at', 'id'),
+        # Unread counts on the dashboard
+        db.Index('ix_contact_messages_is_read', 'is_read'),
+        # {"filter": {"email": ...}} on the bulk message endpoint
+        db.Index('ix_contact_messages_email', 'email'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -141,6 +233,19 @@ class ContactMessage(db.Model):
     is_read = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+class StatCounter(db.Model):
+    __tablename__ = 'stat_counters'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+class SpoolAck(db.Model):
+    __tablename__ = 'contact_spool_acks'
+    
+    # Highest sequence number of a contact spool file committed to the database
+    spool = db.Column(db.String(100), primary_key=True)
+    seq = db.Column(db.Integer, nullable=False, default=0)
+
 class AdminUser(db.Model):
     __tablename__ = 'admin_users'
     
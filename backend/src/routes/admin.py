@@ -1,9 +1,24 @@
-from flask import Blueprint, request, jsonify, session
-from werkzeug.security import check_password_hash, generate_password_hash
+from flask import Blueprint, current_app, request, jsonify, session
+from werkzeug.security import generate_password_hash
 from src.models.portfolio import (
     db, PersonalInfo, Experience, Project, Skill, Education, 
     Language, ContactMessage, AdminUser
 )
+from src.routes.portfolio import refresh_snapshot
+from src.services.serializers import (
+    admin_personal_info_schema, admin_project_schema, admin_skill_schema,
+    admin_user_schema, message_schema, message_summary_schema
+)
+from src.services.stats import get_stats
+from src.services.auth import current_principal, issue_token
+from src.services.passwords import HasherBusy, get_hasher
+from src.services.ratelimit import client_ip, login_username, rate_limited
+from src.services.pagination import InvalidPageRequest, keyset_page, page_args
+from src.services.search import search, search_args
+from src.services.bulk import import_skills, reorder_projects, update_messages
+from src.services.export import export_args, export_messages, export_portfolio
+from sqlalchemy import tuple_
+from datetime import datetime
 from functools import wraps
 import json
 
@@ -12,13 +27,14 @@ admin_bp = Blueprint('admin', __name__)
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if 'admin_id' not in session:
+        if current_principal() is None:
             return jsonify({'success': False, 'message': 'Authentication required'}), 401
         return f(*args, **kwargs)
     return decorated_function
 
 # Authentication routes
 @admin_bp.route('/login', methods=['POST'])
+@rate_limited(('login_ip', client_ip), ('login_username', login_username))
 def login():
     try:
         data = request.get_json()
@@ -29,23 +45,37 @@ def login():
             return jsonify({'success': False, 'message': 'Username and password required'}), 400
         
         admin = AdminUser.query.filter_by(username=username, is_active=True).first()
-        
-        if admin and check_password_hash(admin.password_hash, password):
+        hasher = get_hasher(current_app._get_current_object())
+        
+        if admin and hasher.verify(admin.password_hash, password):
+            try:
+                if hasher.needs_rehash(admin.password_hash):
+                    admin.password_hash = hasher.hash(password)
+                    db.session.commit()
+            except Exception:
+                # Upgrade on a later login instead of failing this one
+                db.session.rollback()
+                current_app.logger.warning('Password rehash for %s failed', admin.username, exc_info=True)
+            
             session['admin_id'] = admin.id
             session['admin_username'] = admin.username
-            return jsonify({
+            payload = {
                 'success': True, 
                 'message': 'Login successful',
-                'admin': {
-                    'id': admin.id,
-                    'username': admin.username,
-                    'email': admin.email
-                }
-            })
+                'admin': admin_user_schema.dump(admin)
+            }
+            if current_app.config['AUTH_TOKENS_ENABLED']:
+                payload['token'] = issue_token(admin)
+                payload['expires_in'] = current_app.config['AUTH_TOKEN_MAX_AGE']
+            return jsonify(payload)
         else:
             return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
             
+    except HasherBusy as e:
+        return jsonify({'success': False, 'message': str(e)}), 503, {'Retry-After': '1'}
+        
     except Exception as e:
+        db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @admin_bp.route('/logout', methods=['POST'])
@@ -56,18 +86,13 @@ def logout():
 
 @admin_bp.route('/check-auth', methods=['GET'])
 def check_auth():
-    if 'admin_id' in session:
-        admin = AdminUser.query.get(session['admin_id'])
-        if admin and admin.is_active:
-            return jsonify({
-                'success': True,
-                'authenticated': True,
-                'admin': {
-                    'id': admin.id,
-                    'username': admin.username,
-                    'email': admin.email
-                }
-            })
+    principal = current_principal()
+    if principal is not None:
+        return jsonify({
+            'success': True,
+            'authenticated': True,
+            'admin': {key: principal[key] for key in admin_user_schema.fields}
+        })
     
     return jsonify({'success': True, 'authenticated': False})
 
@@ -76,32 +101,33 @@ def check_auth():
 @login_required
 def dashboard():
     try:
-        stats = {
-            'total_projects': Project.query.count(),
-            'featured_projects': Project.query.filter_by(is_featured=True).count(),
-            'total_skills': Skill.query.count(),
-            'unread_messages': ContactMessage.query.filter_by(is_read=False).count(),
-            'total_messages': ContactMessage.query.count()
-        }
+        stats = get_stats()
         
         recent_messages = ContactMessage.query.order_by(ContactMessage.created_at.desc()).limit(5).all()
         
         return jsonify({
             'success': True,
             'stats': stats,
-            'recent_messages': [{
-                'id': msg.id,
-                'name': msg.name,
-                'email': msg.email,
-                'subject': msg.subject,
-                'created_at': msg.created_at.isoformat(),
-                'is_read': msg.is_read
-            } for msg in recent_messages]
+            'recent_messages': message_summary_schema.dump_many(recent_messages)
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@admin_bp.route('/export', methods=['GET'])
+@login_required
+def export_portfolio_stream():
+    try:
+        _, after_id, until_id = export_args(formats=('ndjson',))
+        include_messages = request.args.get('messages', 'true').lower() != 'false'
+        return export_portfolio(after_id, until_id, include_messages)
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 # Personal Info routes
 @admin_bp.route('/personal-info', methods=['GET'])
 @login_required
@@ -120,18 +146,11 @@ def get_personal_info():
             )
             db.session.add(info)
             db.session.commit()
+            refresh_snapshot()
         
         return jsonify({
             'success': True,
-            'data': {
-                'id': info.id,
-                'name': info.name,
-                'title': info.title,
-                'email': info.email,
-                'phone': info.phone,
-                'location': info.location,
-                'summary': info.summary
-            }
+            'data': admin_personal_info_schema.dump(info)
         })
         
     except Exception as e:
@@ -156,6 +175,7 @@ def update_personal_info():
         info.summary = data.get('summary', info.summary)
         
         db.session.commit()
+        refresh_snapshot()
         
         return jsonify({'success': True, 'message': 'Personal info updated successfully'})
         
@@ -168,28 +188,30 @@ def update_personal_info():
 @login_required
 def get_projects():
     try:
-        projects = Project.query.order_by(Project.order_index, Project.created_at.desc()).all()
+        limit, cursor = page_args((int, datetime, int))
+        
+        query = Project.query.order_by(Project.order_index, Project.created_at.desc(), Project.id.desc())
+        if cursor:
+            order_index, created_at, project_id = cursor
+            # Two index seeks: the rest of the cursor's order_index group
+            # (most projects share order_index 0), then the groups after it
+            query = [
+                query.filter(Project.order_index == order_index,
+                             tuple_(Project.created_at, Project.id) < (created_at, project_id)),
+                query.filter(Project.order_index > order_index),
+            ]
+        
+        projects, next_cursor = keyset_page(query, limit, lambda p: (p.order_index, p.created_at, p.id))
         
         return jsonify({
             'success': True,
-            'data': [{
-                'id': p.id,
-                'title': p.title,
-                'subtitle': p.subtitle,
-                'description': p.description,
-                'long_description': p.long_description,
-                'technologies': p.get_technologies(),
-                'features': p.get_features(),
-                'image_url': p.image_url,
-                'live_url': p.live_url,
-                'github_url': p.github_url,
-                'status': p.status,
-                'is_featured': p.is_featured,
-                'order_index': p.order_index,
-                'created_at': p.created_at.isoformat()
-            } for p in projects]
+            'data': admin_project_schema.dump_many(projects),
+            'next_cursor': next_cursor
         })
         
+    except InvalidPageRequest as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
@@ -219,9 +241,33 @@ def create_project():
         
         db.session.add(project)
         db.session.commit()
+        refresh_snapshot()
         
         return jsonify({'success': True, 'message': 'Project created successfully', 'id': project.id})
         
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@admin_bp.route('/projects/reorder', methods=['PUT'])
+@login_required
+def reorder_projects_bulk():
+    try:
+        data = request.get_json() or {}
+        results = reorder_projects(data.get('ids', data.get('items')))
+        db.session.commit()
+        refresh_snapshot()
+        
+        return jsonify({'success': True, 'results': results})
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -250,9 +296,14 @@ def update_project(project_id):
             project.set_features(data['features'])
         
         db.session.commit()
+        refresh_snapshot()
         
         return jsonify({'success': True, 'message': 'Project updated successfully'})
         
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -264,6 +315,7 @@ def delete_project(project_id):
         project = Project.query.get_or_404(project_id)
         db.session.delete(project)
         db.session.commit()
+        refresh_snapshot()
         
         return jsonify({'success': True, 'message': 'Project deleted successfully'})
         
@@ -280,14 +332,7 @@ def get_skills():
         
         return jsonify({
             'success': True,
-            'data': [{
-                'id': s.id,
-                'name': s.name,
-                'category': s.category,
-                'level': s.level,
-                'description': s.description,
-                'order_index': s.order_index
-            } for s in skills]
+            'data': admin_skill_schema.dump_many(skills)
         })
         
     except Exception as e:
@@ -309,6 +354,7 @@ def create_skill():
         
         db.session.add(skill)
         db.session.commit()
+        refresh_snapshot()
         
         return jsonify({'success': True, 'message': 'Skill created successfully', 'id': skill.id})
         
@@ -316,29 +362,112 @@ def create_skill():
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@admin_bp.route('/skills/import', methods=['POST'])
+@login_required
+def import_skills_bulk():
+    try:
+        data = request.get_json() or {}
+        results = import_skills(data.get('skills'))
+        db.session.commit()
+        refresh_snapshot()
+        
+        return jsonify({
+            'success': True,
+            'created': sum(1 for r in results if r['status'] == 'created'),
+            'results': results
+        })
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 # Contact Messages routes
 @admin_bp.route('/messages', methods=['GET'])
 @login_required
 def get_messages():
     try:
-        messages = ContactMessage.query.order_by(ContactMessage.created_at.desc()).all()
+        limit, cursor = page_args((datetime, int))
+        
+        query = ContactMessage.query.order_by(ContactMessage.created_at.desc(), ContactMessage.id.desc())
+        if cursor:
+            query = query.filter(tuple_(ContactMessage.created_at, ContactMessage.id) < tuple(cursor))
+        
+        messages, next_cursor = keyset_page(query, limit, lambda m: (m.created_at, m.id))
         
         return jsonify({
             'success': True,
-            'data': [{
-                'id': m.id,
-                'name': m.name,
-                'email': m.email,
-                'subject': m.subject,
-                'message': m.message,
-                'is_read': m.is_read,
-                'created_at': m.created_at.isoformat()
-            } for m in messages]
+            'data': message_schema.dump_many(messages),
+            'next_cursor': next_cursor
         })
         
+    except InvalidPageRequest as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@admin_bp.route('/messages/search', methods=['GET'])
+@login_required
+def search_messages():
+    try:
+        query, limit = search_args()
+        
+        hits = search('contact_messages_fts', query, limit)
+        messages = {}
+        if hits:
+            messages = {m.id: m for m in ContactMessage.query.filter(ContactMessage.id.in_([h['id'] for h in hits]))}
+        
+        return jsonify({
+            'success': True,
+            'data': [
+                dict(message_schema.dump(messages[h['id']]), snippet=h['snippet'], score=h['score'])
+                for h in hits if h['id'] in messages
+            ]
+        })
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@admin_bp.route('/messages/export', methods=['GET'])
+@login_required
+def export_messages_stream():
+    try:
+        fmt, after_id, until_id = export_args()
+        return export_messages(fmt, after_id, until_id)
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@admin_bp.route('/messages/bulk', methods=['POST'])
+@login_required
+def bulk_messages():
+    try:
+        data = request.get_json() or {}
+        results = update_messages(data.get('action'), data.get('ids'), data.get('filter'))
+        db.session.commit()
+        
+        if data.get('ids') is not None:
+            return jsonify({'success': True, 'results': results})
+        return jsonify({'success': True, 'affected': len(results), 'ids': results})
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 @admin_bp.route('/messages/<int:message_id>/read', methods=['PUT'])
 @login_required
 def mark_message_read(message_id):
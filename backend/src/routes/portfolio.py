@@ -1,192 +1,301 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, g, request, jsonify
+from sqlalchemy import select
+from threading import Lock
 from src.models.portfolio import (
-    db, PersonalInfo, Experience, Project, Skill, Education, 
+    db, PersonalInfo, Experience, Project, ProjectTechnology, Skill, Education, 
     Language, ContactMessage
 )
+from src.services.cache import CONTENT_MODELS, cached_response, content_changed
+from src.services.conditional import conditional, resource_state
+from src.services.contact_queue import get_contact_queue, validate_contact
+from src.services.images import ImageNotFound, RenderBusy, serve_image
+from src.services.ratelimit import client_ip, rate_limited
+from src.services.search import search, search_args
+from src.services.serializers import (
+    personal_info_schema, project_schema, skill_schema, experience_schema,
+    education_schema, language_schema
+)
 
 portfolio_bp = Blueprint('portfolio', __name__)
 
+# Materialized snapshot of every public resource, served by /bundle
+_snapshot = None
+_snapshot_generation = 0
+_snapshot_lock = Lock()
+
+def build_snapshot():
+    """Serialize all public portfolio data into one pre-encoded JSON body"""
+    return current_app.json.dumps({
+        'success': True,
+        'data': {
+            'personal_info': personal_info_data(),
+            'projects': projects_data(),
+            'skills': skills_data(),
+            'experience': experience_data(),
+            'education': education_data(),
+            'languages': languages_data()
+        }
+    }).encode('utf-8')
+
+def invalidate_snapshot(*args, **kwargs):
+    global _snapshot, _snapshot_generation
+    with _snapshot_lock:
+        _snapshot_generation += 1
+        _snapshot = None
+
+# Any committed content change drops the snapshot, not only admin routes
+content_changed.connect(invalidate_snapshot)
+
+def refresh_snapshot():
+    """Rebuild the snapshot; called by admin routes after they commit"""
+    invalidate_snapshot()
+    try:
+        get_snapshot(tuple(resource_state(CONTENT_MODELS)))
+    except Exception:
+        # The admin write already succeeded; the next bundle read retries the build
+        pass
+
+def get_snapshot(tag=None):
+    """Return the snapshot body, rebuilding it if missing or built for another state
+    
+    The tag is the content models' resource_state(), which also changes when
+    another worker process commits.
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None or (tag is not None and snapshot[0] != tag):
+        generation = _snapshot_generation
+        snapshot = (tag, build_snapshot())
+        with _snapshot_lock:
+            # Don't overwrite a refresh that happened while we were building
+            if generation == _snapshot_generation:
+                _snapshot = snapshot
+    return snapshot[1]
+
+# Statements and renderers are shared with the async read path in src/asgi.py
+DEFAULT_PERSONAL_INFO = {
+    'name': 'Mahmoud Glala',
+    'title': 'Full Stack Developer & UI/UX Enthusiast',
+    'email': 'mahmoud.glala@example.com',
+    'phone': '+20 123 456 7890',
+    'location': 'Egypt',
+    'summary': 'Highly motivated and results-oriented Full Stack Developer with a strong passion for creating innovative and user-centric web applications.'
+}
+
+def personal_info_query():
+    return select(PersonalInfo).limit(1)
+
+def render_personal_info(info):
+    if not info:
+        return dict(DEFAULT_PERSONAL_INFO)
+    return personal_info_schema.dump(info)
+
+def projects_query(featured_only=False, tech=None):
+    query = select(Project)
+    if tech:
+        # Semi-join answered from ix_project_technologies_name_project_id
+        query = query.where(Project.id.in_(
+            select(ProjectTechnology.project_id).where(ProjectTechnology.name == tech)
+        ))
+    
+    if featured_only:
+        return query.where(Project.is_featured == True).order_by(Project.order_index)
+    return query.order_by(Project.order_index, Project.created_at.desc())
+
+def skills_query():
+    return select(Skill).order_by(Skill.category, Skill.order_index)
+
+def render_skills(skills):
+    # Group skills by category
+    skills_by_category = {}
+    for skill in skills:
+        if skill.category not in skills_by_category:
+            skills_by_category[skill.category] = []
+        skills_by_category[skill.category].append(skill_schema.dump(skill))
+    
+    return skills_by_category
+
+def experience_query():
+    return select(Experience).order_by(Experience.order_index, Experience.created_at.desc())
+
+def education_query():
+    return select(Education).order_by(Education.order_index, Education.created_at.desc())
+
+def languages_query():
+    return select(Language).order_by(Language.order_index)
+
+def personal_info_data():
+    return render_personal_info(db.session.scalars(personal_info_query()).first())
+
+def projects_data(featured_only=False, tech=None):
+    return project_schema.dump_many(db.session.scalars(projects_query(featured_only, tech)).all())
+
+def skills_data():
+    return render_skills(db.session.scalars(skills_query()).all())
+
+def experience_data():
+    return experience_schema.dump_many(db.session.scalars(experience_query()).all())
+
+def education_data():
+    return education_schema.dump_many(db.session.scalars(education_query()).all())
+
+def languages_data():
+    return language_schema.dump_many(db.session.scalars(languages_query()).all())
+
 # Public routes for frontend
+@portfolio_bp.route('/bundle', methods=['GET'])
+@conditional(*CONTENT_MODELS)
+def get_bundle():
+    try:
+        return Response(get_snapshot(g.resource_state), mimetype='application/json')
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 @portfolio_bp.route('/personal-info', methods=['GET'])
+@conditional(PersonalInfo)
+@cached_response
 def get_personal_info():
     try:
-        info = PersonalInfo.query.first()
-        if not info:
-            return jsonify({
-                'success': True,
-                'data': {
-                    'name': 'Mahmoud Glala',
-                    'title': 'Full Stack Developer & UI/UX Enthusiast',
-                    'email': 'mahmoud.glala@example.com',
-                    'phone': '+20 123 456 7890',
-                    'location': 'Egypt',
-                    'summary': 'Highly motivated and results-oriented Full Stack Developer with a strong passion for creating innovative and user-centric web applications.'
-                }
-            })
-        
         return jsonify({
             'success': True,
-            'data': {
-                'name': info.name,
-                'title': info.title,
-                'email': info.email,
-                'phone': info.phone,
-                'location': info.location,
-                'summary': info.summary
-            }
+            'data': personal_info_data()
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @portfolio_bp.route('/projects', methods=['GET'])
+@conditional(Project)
+@cached_response
 def get_projects():
     try:
         featured_only = request.args.get('featured', 'false').lower() == 'true'
+        tech = request.args.get('tech')
         
-        if featured_only:
-            projects = Project.query.filter_by(is_featured=True).order_by(Project.order_index).all()
-        else:
-            projects = Project.query.order_by(Project.order_index, Project.created_at.desc()).all()
+        return jsonify({
+            'success': True,
+            'data': projects_data(featured_only, tech)
+        })
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@portfolio_bp.route('/search', methods=['GET'])
+# Not @cached_response: arbitrary q values would evict the hot route entries
+@conditional(Project, Experience)
+def search_portfolio():
+    try:
+        query, limit = search_args()
         
         return jsonify({
             'success': True,
-            'data': [{
-                'id': p.id,
-                'title': p.title,
-                'subtitle': p.subtitle,
-                'description': p.description,
-                'long_description': p.long_description,
-                'technologies': p.get_technologies(),
-                'features': p.get_features(),
-                'image_url': p.image_url,
-                'live_url': p.live_url,
-                'github_url': p.github_url,
-                'status': p.status,
-                'is_featured': p.is_featured
-            } for p in projects]
+            'data': {
+                'projects': search('projects_fts', query, limit, ('id', 'title', 'subtitle')),
+                'experience': search('experience_fts', query, limit, ('id', 'title', 'company'))
+            }
         })
         
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @portfolio_bp.route('/projects/<int:project_id>', methods=['GET'])
+@conditional(Project, where=lambda project_id: [Project.id == project_id])
+@cached_response
 def get_project(project_id):
     try:
         project = Project.query.get_or_404(project_id)
         
         return jsonify({
             'success': True,
-            'data': {
-                'id': project.id,
-                'title': project.title,
-                'subtitle': project.subtitle,
-                'description': project.description,
-                'long_description': project.long_description,
-                'technologies': project.get_technologies(),
-                'features': project.get_features(),
-                'image_url': project.image_url,
-                'live_url': project.live_url,
-                'github_url': project.github_url,
-                'status': project.status,
-                'is_featured': project.is_featured
-            }
+            'data': project_schema.dump(project)
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @portfolio_bp.route('/skills', methods=['GET'])
+@conditional(Skill)
+@cached_response
 def get_skills():
     try:
-        skills = Skill.query.order_by(Skill.category, Skill.order_index).all()
-        
-        # Group skills by category
-        skills_by_category = {}
-        for skill in skills:
-            if skill.category not in skills_by_category:
-                skills_by_category[skill.category] = []
-            skills_by_category[skill.category].append({
-                'id': skill.id,
-                'name': skill.name,
-                'level': skill.level,
-                'description': skill.description
-            })
-        
         return jsonify({
             'success': True,
-            'data': skills_by_category
+            'data': skills_data()
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @portfolio_bp.route('/experience', methods=['GET'])
+@conditional(Experience)
+@cached_response
 def get_experience():
     try:
-        experiences = Experience.query.order_by(Experience.order_index, Experience.created_at.desc()).all()
-        
         return jsonify({
             'success': True,
-            'data': [{
-                'id': e.id,
-                'title': e.title,
-                'company': e.company,
-                'period': e.period,
-                'location': e.location,
-                'description': e.description,
-                'responsibilities': e.get_responsibilities(),
-                'projects': e.get_projects()
-            } for e in experiences]
+            'data': experience_data()
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @portfolio_bp.route('/education', methods=['GET'])
+@conditional(Education)
+@cached_response
 def get_education():
     try:
-        education = Education.query.order_by(Education.order_index, Education.created_at.desc()).all()
-        
         return jsonify({
             'success': True,
-            'data': [{
-                'id': e.id,
-                'degree': e.degree,
-                'field': e.field,
-                'institution': e.institution,
-                'period': e.period,
-                'description': e.description
-            } for e in education]
+            'data': education_data()
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @portfolio_bp.route('/languages', methods=['GET'])
+@conditional(Language)
+@cached_response
 def get_languages():
     try:
-        languages = Language.query.order_by(Language.order_index).all()
-        
         return jsonify({
             'success': True,
-            'data': [{
-                'id': l.id,
-                'name': l.name,
-                'level': l.level
-            } for l in languages]
+            'data': languages_data()
         })
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@portfolio_bp.route('/images/<path:name>', methods=['GET'])
+def get_image(name):
+    try:
+        return serve_image(name, request.args.get('w', type=int), request.args.get('fmt'))
+        
+    except ImageNotFound:
+        return jsonify({'success': False, 'message': 'Image not found'}), 404
+        
+    except RenderBusy as e:
+        return jsonify({'success': False, 'message': str(e)}), 503, {'Retry-After': '1'}
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 @portfolio_bp.route('/contact', methods=['POST'])
+@rate_limited(('contact_ip', client_ip))
 def submit_contact():
     try:
-        data = request.get_json()
+        data = validate_contact(request.get_json(silent=True))
         
-        if not all(key in data for key in ['name', 'email', 'subject', 'message']):
-            return jsonify({'success': False, 'message': 'All fields are required'}), 400
+        if current_app.config['CONTACT_WRITE_BEHIND']:
+            # Spooled to disk now, committed by the background writer in batches
+            get_contact_queue(current_app._get_current_object()).submit(data)
+            return jsonify({'success': True, 'message': 'Message sent successfully'}), 202
         
         message = ContactMessage(
             name=data['name'],
@@ -200,7 +309,9 @@ def submit_contact():
         
         return jsonify({'success': True, 'message': 'Message sent successfully'})
         
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+        
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
-
@@ -0,0 +1,113 @@
+import hashlib
+import time
+from threading import Lock
+from flask import current_app, g, request, session
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+from src.models.portfolio import db, AdminUser
+from src.services.serializers import admin_user_schema
+
+TOKEN_SALT = 'admin-bearer-token'
+
+def credential_fingerprint(password_hash):
+    """Changes whenever the password does, so it revokes tokens issued before"""
+    return hashlib.sha256(password_hash.encode('utf-8')).hexdigest()[:16]
+
+class PrincipalCache:
+    """Short-lived copies of admin identities, keyed by user id
+    
+    Entries are dropped when an AdminUser row changes in this process; other
+    processes pick the change up within ``ttl`` seconds.
+    """
+    
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = Lock()
+    
+    def get(self, admin_id):
+        """The principal dict for an active admin, or None"""
+        now = time.monotonic()
+        entry = self._entries.get(admin_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        admin = db.session.get(AdminUser, admin_id)
+        principal = None
+        if admin is not None and admin.is_active:
+            principal = dict(admin_user_schema.dump(admin), fingerprint=credential_fingerprint(admin.password_hash))
+        with self._lock:
+            self._entries[admin_id] = (now + self.ttl, principal)
+        return principal
+    
+    def invalidate(self, admin_id):
+        with self._lock:
+            self._entries.pop(admin_id, None)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+principal_cache = PrincipalCache()
+
+@event.listens_for(AdminUser, 'after_update')
+@event.listens_for(AdminUser, 'after_delete')
+def _admin_changed(mapper, connection, target):
+    principal_cache.invalidate(target.id)
+    # Again after commit, in case a request re-cached the old row in between
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('changed_admin_ids', set()).add(target.id)
+
+def _invalidate_committed(session):
+    for admin_id in session.info.pop('changed_admin_ids', ()):
+        principal_cache.invalidate(admin_id)
+
+def _discard_changes(session):
+    session.info.pop('changed_admin_ids', None)
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt=TOKEN_SALT)
+
+def issue_token(admin):
+    return _serializer().dumps({'id': admin.id, 'fp': credential_fingerprint(admin.password_hash)})
+
+def _bearer_principal(token):
+    try:
+        payload = _serializer().loads(token, max_age=current_app.config['AUTH_TOKEN_MAX_AGE'])
+    except (SignatureExpired, BadSignature):
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get('id'), int):
+        return None
+    principal = principal_cache.get(payload['id'])
+    if principal is None or principal['fingerprint'] != payload.get('fp'):
+        return None
+    return principal
+
+def current_principal():
+    """The authenticated admin for this request (bearer token or session), or None"""
+    if 'admin_principal' in g:
+        return g.admin_principal
+    
+    principal = None
+    authorization = request.headers.get('Authorization', '')
+    if current_app.config['AUTH_TOKENS_ENABLED'] and authorization.startswith('Bearer '):
+        principal = _bearer_principal(authorization[len('Bearer '):].strip())
+    elif 'admin_id' in session:
+        principal = principal_cache.get(session['admin_id'])
+        if principal is None:
+            # Deactivated or deleted since login
+            session.clear()
+    g.admin_principal = principal
+    return principal
+
+_hooks_registered = False
+
+def init_auth(app):
+    global _hooks_registered
+    principal_cache.ttl = app.config['AUTH_PRINCIPAL_TTL']
+    if not _hooks_registered:
+        event.listen(db.session, 'after_commit', _invalidate_committed)
+        event.listen(db.session, 'after_rollback', _discard_changes)
+        _hooks_registered = True
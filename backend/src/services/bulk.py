@@ -0,0 +1,156 @@
+from datetime import datetime
+from sqlalchemy import case, delete, select, update
+from src.models.portfolio import db, Project, Skill, ContactMessage
+from src.services.stats import bump_counters
+
+# Upper bound on ids/items per request; also keeps IN lists under SQLite's variable limit
+MAX_BULK_ITEMS = 1000
+
+MESSAGE_ACTIONS = ('mark_read', 'mark_unread', 'delete')
+
+def _id_list(ids):
+    if not isinstance(ids, list) or not ids:
+        raise ValueError('ids must be a non-empty list')
+    if len(ids) > MAX_BULK_ITEMS:
+        raise ValueError(f'At most {MAX_BULK_ITEMS} items per request')
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        raise ValueError('ids must be integers')
+    return list(dict.fromkeys(ids))
+
+def _results(ids, changed, existing, status):
+    return [
+        {'id': i, 'status': status if i in changed else 'unchanged' if i in existing else 'not_found'}
+        for i in ids
+    ]
+
+def reorder_projects(items):
+    """Set ``order_index`` on many projects with one UPDATE
+    
+    ``items`` is either a list of ids in their new order or a list of
+    ``{'id': ..., 'order_index': ...}`` objects.
+    """
+    if isinstance(items, list) and items and all(isinstance(item, dict) for item in items):
+        try:
+            # Validated before use as dict keys: [1] is unhashable and True == 1
+            _id_list([item['id'] for item in items])
+            order = {item['id']: item['order_index'] for item in items}
+        except KeyError as e:
+            raise ValueError(f'Every item needs {e.args[0]}')
+        if not all(isinstance(v, int) and not isinstance(v, bool) for v in order.values()):
+            raise ValueError('order_index must be an integer')
+    else:
+        order = {project_id: position for position, project_id in enumerate(_id_list(items))}
+    ids = _id_list(list(order))
+    
+    # Core UPDATE bypasses the unit of work, so updated_at is set explicitly
+    changed = set(db.session.scalars(
+        update(Project)
+        .where(Project.id.in_(ids))
+        .values(order_index=case(order, value=Project.id), updated_at=datetime.utcnow())
+        .returning(Project.id)
+        .execution_options(synchronize_session='fetch')
+    ))
+    return _results(ids, changed, changed, 'updated')
+
+def _message_criteria(ids, filters):
+    if ids is not None:
+        return [ContactMessage.id.in_(_id_list(ids))]
+    if not isinstance(filters, dict) or not filters:
+        raise ValueError('Either ids or a non-empty filter is required')
+    
+    criteria = []
+    for key, value in filters.items():
+        if key == 'is_read':
+            # bool("false") is True; only a JSON boolean is unambiguous
+            if not isinstance(value, bool):
+                raise ValueError('is_read must be true or false')
+            criteria.append(ContactMessage.is_read == value)
+        elif key == 'email':
+            criteria.append(ContactMessage.email == value)
+        elif key == 'before':
+            try:
+                criteria.append(ContactMessage.created_at < datetime.fromisoformat(value))
+            except (TypeError, ValueError):
+                raise ValueError('before must be an ISO 8601 datetime')
+        else:
+            raise ValueError(f'Unknown filter: {key}')
+    return criteria
+
+def update_messages(action, ids=None, filters=None):
+    """Mark read/unread or delete messages selected by id list or filter
+    
+    Returns per-id results for an id list, or the affected ids for a filter.
+    Stat counters are adjusted here because set-based statements skip the
+    mapper events that normally maintain them.
+    """
+    if action not in MESSAGE_ACTIONS:
+        raise ValueError(f"action must be one of {', '.join(MESSAGE_ACTIONS)}")
+    criteria = _message_criteria(ids, filters)
+    
+    if action == 'delete':
+        rows = db.session.execute(
+            delete(ContactMessage).where(*criteria)
+            .returning(ContactMessage.id, ContactMessage.is_read)
+            .execution_options(synchronize_session='fetch')
+        ).all()
+        changed = {row.id for row in rows}
+        bump_counters(db.session.connection(), total_messages=-len(rows),
+                      unread_messages=-sum(1 for row in rows if not row.is_read))
+        existing = changed
+        status = 'deleted'
+    else:
+        is_read = action == 'mark_read'
+        changed = set(db.session.scalars(
+            update(ContactMessage)
+            .where(*criteria, ContactMessage.is_read != is_read)
+            .values(is_read=is_read)
+            .returning(ContactMessage.id)
+            .execution_options(synchronize_session='fetch')
+        ))
+        bump_counters(db.session.connection(), unread_messages=-len(changed) if is_read else len(changed))
+        existing = None
+        status = 'updated'
+    
+    if ids is None:
+        return sorted(changed)
+    if existing is None:
+        existing = set(db.session.scalars(select(ContactMessage.id).where(*criteria)))
+    return _results(list(dict.fromkeys(ids)), changed, existing, status)
+
+def import_skills(items):
+    """Validate and add many skills; invalid items are reported and skipped"""
+    if not isinstance(items, list) or not items:
+        raise ValueError('skills must be a non-empty list')
+    if len(items) > MAX_BULK_ITEMS:
+        raise ValueError(f'At most {MAX_BULK_ITEMS} items per request')
+    
+    results = []
+    skills = []
+    for position, item in enumerate(items):
+        error = None
+        if not isinstance(item, dict):
+            error = 'must be an object'
+        elif not item.get('name') or not item.get('category'):
+            error = 'name and category are required'
+        elif not isinstance(item.get('level', 50), int) or not 0 <= item.get('level', 50) <= 100:
+            error = 'level must be an integer between 0 and 100'
+        
+        if error:
+            results.append({'index': position, 'status': 'error', 'message': error})
+            continue
+        skill = Skill(
+            name=item['name'],
+            category=item['category'],
+            level=item.get('level', 50),
+            description=item.get('description'),
+            order_index=item.get('order_index', 0)
+        )
+        skills.append(skill)
+        results.append({'index': position, 'status': 'created', 'skill': skill})
+    
+    db.session.add_all(skills)
+    db.session.flush()
+    for result in results:
+        if 'skill' in result:
+            result['id'] = result.pop('skill').id
+    return results
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from blinker import Namespace
+from flask import Response, g, make_response, request
+from sqlalchemy import event
+from src.models.portfolio import (
+    db, PersonalInfo, Experience, Project, Skill, Education, Language
+)
+
+# Models whose rows are rendered by the public portfolio routes
+CONTENT_MODELS = (PersonalInfo, Experience, Project, Skill, Education, Language)
+
+_signals = Namespace()
+content_changed = _signals.signal('content-changed')
+
+_version = 0
+_version_lock = Lock()
+
+def content_version():
+    return _version
+
+def bump_content_version():
+    """Invalidate everything derived from portfolio content"""
+    global _version
+    with _version_lock:
+        _version += 1
+        version = _version
+    content_changed.send(version=version)
+    return version
+
+class ResponseCache:
+    """Bounded LRU of encoded response bodies, tagged with the content version"""
+    
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, version, value):
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
+
+response_cache = ResponseCache()
+
+def cached_response(f):
+    """Serve a GET route from the response cache until portfolio content changes"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        # Read the version before building so a concurrent commit can't be masked.
+        # The ETag set by @conditional also catches commits made by other workers.
+        version = (content_version(), g.get('resource_etag'))
+        hit = response_cache.get(key, version)
+        if hit is not None:
+            body, mimetype = hit
+            return Response(body, mimetype=mimetype)
+        
+        response = make_response(f(*args, **kwargs))
+        if response.status_code == 200 and not response.direct_passthrough:
+            response_cache.set(key, version, (response.get_data(), response.mimetype))
+        return response
+    return decorated_function
+
+def _track_content_changes(session, flush_context):
+    if session.info.get('content_changed'):
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, CONTENT_MODELS):
+            session.info['content_changed'] = True
+            return
+
+def _track_bulk_content_changes(orm_execute_state):
+    # Set-based INSERT/UPDATE/DELETE statements never reach after_flush
+    state = orm_execute_state
+    if (state.is_insert or state.is_update or state.is_delete) and any(
+            issubclass(mapper.class_, CONTENT_MODELS) for mapper in state.all_mappers):
+        state.session.info['content_changed'] = True
+
+def _commit_content_changes(session):
+    if session.info.pop('content_changed', False):
+        bump_content_version()
+
+def _discard_content_changes(session):
+    session.info.pop('content_changed', None)
+
+_hooks_registered = False
+
+def init_cache(app):
+    global _hooks_registered
+    response_cache.max_entries = app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 256)
+    if not _hooks_registered:
+        event.listen(db.session, 'after_flush', _track_content_changes)
+        event.listen(db.session, 'do_orm_execute', _track_bulk_content_changes)
+        event.listen(db.session, 'after_commit', _commit_content_changes)
+        event.listen(db.session, 'after_rollback', _discard_content_changes)
+        _hooks_registered = True
@@ -0,0 +1,85 @@
+import hashlib
+from datetime import timezone
+from functools import wraps
+from flask import Response, g, make_response, request
+from sqlalchemy import func, select
+from src.models.portfolio import db
+
+def resource_state_statement(models, criteria=()):
+    """SELECT of (max updated_at, row count) scalar subqueries for each model"""
+    columns = []
+    for model in models:
+        columns.append(select(func.max(model.updated_at)).where(*criteria).scalar_subquery())
+        columns.append(select(func.count()).select_from(model).where(*criteria).scalar_subquery())
+    return select(*columns)
+
+def state_pairs(row):
+    return [(row[i], row[i + 1]) for i in range(0, len(row), 2)]
+
+def resource_state(models, criteria=()):
+    """Return (max updated_at, row count) for each model in a single query"""
+    return state_pairs(db.session.execute(resource_state_statement(models, criteria)).one())
+
+def compute_validators(path, args, state, single=False):
+    """ETag and Last-Modified for a URL (path and sorted query items) at a resource state
+    
+    Last-Modified is only given for ``single``-item resources: deleting a row
+    other than the newest leaves max(updated_at) unchanged, so it cannot
+    validate a collection. Collections rely on the ETag, which includes the
+    row counts.
+    """
+    digest = hashlib.sha1(path.encode('utf-8'))
+    for key, value in args:
+        digest.update(f'&{key}={value}'.encode('utf-8'))
+    for updated_at, count in state:
+        digest.update(f'|{updated_at.isoformat() if updated_at else ""}:{count}'.encode('utf-8'))
+    
+    timestamps = [updated_at for updated_at, _ in state if updated_at]
+    last_modified = None
+    if single and timestamps:
+        # HTTP dates have one-second resolution
+        last_modified = max(timestamps).replace(tzinfo=timezone.utc, microsecond=0)
+    return digest.hexdigest(), last_modified
+
+def _validators(models, criteria, single):
+    state = resource_state(models, criteria)
+    g.resource_state = tuple(state)
+    return compute_validators(request.path, sorted(request.args.items(multi=True)), state, single)
+
+def _not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if last_modified and request.if_modified_since:
+        return last_modified <= request.if_modified_since
+    return False
+
+def conditional(*models, where=None):
+    """Answer conditional GETs from the models' updated_at columns and row counts
+    
+    The validators are computed with one aggregate query, so a 304 never loads
+    or serializes the underlying rows. ``where`` maps the view arguments to
+    extra criteria, e.g. the primary key of a single-item route; only those
+    routes get Last-Modified.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            criteria = where(**kwargs) if where else ()
+            etag, last_modified = _validators(models, criteria, where is not None)
+            g.resource_etag = etag
+            
+            if _not_modified(etag, last_modified):
+                response = Response(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag)
+            if last_modified:
+                response.last_modified = last_modified
+            # Let browsers and the CDN keep the body but always revalidate it
+            response.cache_control.no_cache = True
+            return response
+        return decorated_function
+    return decorator
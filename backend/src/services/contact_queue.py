@@ -0,0 +1,256 @@
+import atexit
+import fcntl
+import glob
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+from sqlalchemy.exc import OperationalError
+from src.models.portfolio import db, ContactMessage, SpoolAck
+
+logger = logging.getLogger(__name__)
+_start_lock = threading.Lock()
+
+SPOOL_SUFFIX = '.spool'
+DEAD_LETTER_FILE = 'dead-letter.jsonl'
+FIELDS = ('name', 'email', 'subject', 'message')
+
+def validate_contact(data):
+    """The submitted contact fields, or ValueError unless all are non-empty strings"""
+    if not isinstance(data, dict) or not all(key in data for key in FIELDS):
+        raise ValueError('All fields are required')
+    for field in FIELDS:
+        if not isinstance(data[field], str):
+            raise ValueError(f'{field} must be a string')
+        if not data[field].strip():
+            raise ValueError('All fields are required')
+    return {field: data[field] for field in FIELDS}
+
+def _ack_key(spool_path):
+    # Highest spool sequence number committed to the database, stored in the
+    # same transaction as the messages so replay after a crash is exact
+    return os.path.basename(spool_path)[:-len(SPOOL_SUFFIX)]
+
+def _message(record):
+    validate_contact(record)
+    return ContactMessage(created_at=datetime.fromisoformat(record['created_at']),
+                          **{field: record[field] for field in FIELDS})
+
+class ContactQueue:
+    """Write-behind queue for contact form submissions
+    
+    submit() appends the message to a per-process spool file and returns; a
+    background thread inserts queued messages in batched transactions, flushing
+    when ``batch_size`` messages are waiting or ``flush_interval`` seconds have
+    passed. Spools left behind by crashed processes are replayed on startup.
+    """
+    
+    def __init__(self, app, spool_dir, batch_size=100, flush_interval=0.5, fsync=True):
+        self.app = app
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.pid = os.getpid()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._seq = 0
+        self._acked = 0
+        self._spool = None
+        self._spool_path = None
+        self._thread = None
+    
+    def start(self):
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._spool_path = os.path.join(self.spool_dir, f'contact-{os.getpid()}-{uuid.uuid4().hex[:8]}{SPOOL_SUFFIX}')
+        self._spool = open(self._spool_path, 'a+', encoding='utf-8')
+        # Held for the life of the process; an unlocked spool belongs to a dead one
+        fcntl.flock(self._spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        
+        self.recover()
+        self._thread = threading.Thread(target=self._run, name='contact-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def submit(self, data):
+        record = validate_contact(data)
+        record['created_at'] = datetime.utcnow().isoformat()
+        with self._lock:
+            self._seq += 1
+            record['seq'] = self._seq
+            self._spool.write(json.dumps(record) + '\n')
+            self._spool.flush()
+            if self.fsync:
+                os.fsync(self._spool.fileno())
+        self._queue.put(record)
+    
+    def pending(self):
+        return self._queue.qsize()
+    
+    def stop(self, timeout=10):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        # Only discard the spool once everything in it is committed
+        if self._acked == self._seq:
+            with self.app.app_context():
+                SpoolAck.query.filter_by(spool=_ack_key(self._spool_path)).delete()
+                db.session.commit()
+            self._spool.close()
+            os.remove(self._spool_path)
+    
+    def _run(self):
+        while not self._stop.is_set() or not self._queue.empty():
+            batch = self._take_batch()
+            while batch:
+                batch = batch[self._write(batch):]
+                if batch:
+                    if self._stop.is_set():
+                        return
+                    time.sleep(min(self.flush_interval * 4, 5))
+    
+    def _take_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _write(self, batch):
+        """Store a batch, returning how many of its leading records are committed"""
+        done = self._store(_ack_key(self._spool_path), batch)
+        if done:
+            with self._lock:
+                self._acked = batch[done - 1]['seq']
+                # Compact the spool once it holds nothing uncommitted
+                if self._acked == self._seq:
+                    self._spool.truncate(0)
+                    self._spool.flush()
+        return done
+    
+    def _store(self, key, records):
+        """Insert records and ack them under ``key``, returning how many are done
+        
+        Lock/busy errors (OperationalError) leave the rest for a retry. Any
+        other error is a problem with a statement, so the batch is retried row
+        by row and rows that still fail are dead-lettered and acked.
+        """
+        try:
+            self._commit(key, records, records[-1]['seq'])
+            return len(records)
+        except OperationalError:
+            logger.exception('Failed to write %d contact messages, will retry', len(records))
+            return 0
+        except Exception:
+            logger.exception('Failed to write %d contact messages, retrying one by one', len(records))
+        
+        for done, record in enumerate(records):
+            try:
+                self._commit(key, [record], record['seq'])
+            except OperationalError:
+                logger.exception('Failed to write contact message %s, will retry', record['seq'])
+                return done
+            except Exception as e:
+                try:
+                    self._dead_letter(key, record, e)
+                    self._commit(key, [], record['seq'])
+                except Exception:
+                    logger.exception('Failed to dead-letter contact message %s, will retry', record['seq'])
+                    return done
+        return len(records)
+    
+    def _commit(self, key, records, seq):
+        with self.app.app_context():
+            try:
+                db.session.add_all([_message(record) for record in records])
+                db.session.merge(SpoolAck(spool=key, seq=seq))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+    
+    def _dead_letter(self, key, record, error):
+        logger.error('Dead-lettering contact message %s from %s: %s', record.get('seq'), key, error)
+        line = json.dumps({'spool': key, 'error': str(error), 'record': record}, default=str)
+        with open(os.path.join(self.spool_dir, DEAD_LETTER_FILE), 'a', encoding='utf-8') as dead:
+            dead.write(line + '\n')
+    
+    def recover(self):
+        """Replay spools whose owning process died
+        
+        Unreadable records are dead-lettered rather than raised, and a spool
+        that cannot be fully written is left in place for the next start.
+        """
+        for path in glob.glob(os.path.join(self.spool_dir, '*' + SPOOL_SUFFIX)):
+            if path == self._spool_path:
+                continue
+            try:
+                if self._recover_spool(path):
+                    os.remove(path)
+            except Exception:
+                logger.exception('Failed to recover contact spool %s', path)
+    
+    def _recover_spool(self, path):
+        key = _ack_key(path)
+        with open(path, 'r+', encoding='utf-8') as spool:
+            try:
+                fcntl.flock(spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False  # still owned by a live worker
+            
+            with self.app.app_context():
+                ack = db.session.get(SpoolAck, key)
+                acked = ack.seq if ack else 0
+            records = []
+            for line in spool:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn final write
+                if not isinstance(record, dict) or not isinstance(record.get('seq'), int):
+                    self._dead_letter(key, {'line': line.rstrip('\n')}, 'malformed spool record')
+                    continue
+                if record['seq'] > acked:
+                    records.append(record)
+            
+            if records and self._store(key, records) < len(records):
+                return False
+            with self.app.app_context():
+                SpoolAck.query.filter_by(spool=key).delete()
+                db.session.commit()
+        if records:
+            logger.warning('Recovered %d contact messages from %s', len(records), path)
+        return True
+
+def get_contact_queue(app):
+    """The process's queue, started on first use so forked workers each get their own"""
+    contact_queue = app.extensions.get('contact_queue')
+    if contact_queue is None or contact_queue.pid != os.getpid():
+        with _start_lock:
+            contact_queue = app.extensions.get('contact_queue')
+            if contact_queue is None or contact_queue.pid != os.getpid():
+                contact_queue = ContactQueue(
+                    app, app.config['CONTACT_SPOOL_DIR'],
+                    batch_size=app.config['CONTACT_BATCH_SIZE'],
+                    flush_interval=app.config['CONTACT_FLUSH_INTERVAL'],
+                    fsync=app.config['CONTACT_SPOOL_FSYNC']
+                )
+                contact_queue.start()
+                app.extensions['contact_queue'] = contact_queue
+    return contact_queue
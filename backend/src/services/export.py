@@ -0,0 +1,124 @@
+import csv
+import io
+from datetime import datetime
+from flask import Response, current_app, request, stream_with_context
+from sqlalchemy import select
+from src.models.portfolio import (
+    db, PersonalInfo, Experience, Project, Skill, Education, Language, ContactMessage
+)
+from src.services.serializers import (
+    admin_personal_info_schema, admin_project_schema, admin_skill_schema, experience_schema,
+    education_schema, language_schema, message_schema
+)
+
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+# Rows fetched from the cursor and written to the response per chunk
+BATCH_SIZE = 1000
+# Leading characters that make spreadsheet applications evaluate a cell
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# Record type -> (model, schema) for the full-portfolio export, in output order
+PORTFOLIO_TABLES = (
+    ('personal_info', PersonalInfo, admin_personal_info_schema),
+    ('project', Project, admin_project_schema),
+    ('skill', Skill, admin_skill_schema),
+    ('experience', Experience, experience_schema),
+    ('education', Education, education_schema),
+    ('language', Language, language_schema),
+)
+
+def _id_arg(name):
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+
+def export_args(formats=EXPORT_FORMATS):
+    """Read ``format``, ``after_id`` (exclusive) and ``until_id`` (inclusive)"""
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in formats:
+        raise ValueError(f"format must be one of {', '.join(formats)}")
+    return fmt, _id_arg('after_id'), _id_arg('until_id')
+
+def _id_range(model, after_id, until_id):
+    criteria = []
+    if after_id is not None:
+        criteria.append(model.id > after_id)
+    if until_id is not None:
+        criteria.append(model.id <= until_id)
+    return criteria
+
+def _message_rows(after_id, until_id):
+    # Plain column rows: no ORM identity map, and message_schema reads them by name
+    columns = [getattr(ContactMessage, key) for key in message_schema.keys]
+    statement = (select(*columns).where(*_id_range(ContactMessage, after_id, until_id))
+                 .order_by(ContactMessage.id).execution_options(yield_per=BATCH_SIZE))
+    for partition in db.session.execute(statement).partitions():
+        yield [message_schema.dump(row) for row in partition]
+
+def _ndjson(batches, wrap=None):
+    dumps = current_app.json.dumps
+    for batch in batches:
+        yield ''.join(dumps(wrap(item) if wrap else item) + '\n' for item in batch)
+
+def _csv_cell(value):
+    # Message fields come from anonymous visitors; keep them inert in spreadsheets
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def _csv(batches, keys):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+    for batch in batches:
+        writer.writerows([_csv_cell(item[key]) for key in keys] for item in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def _streaming_response(chunks, fmt, name):
+    filename = f"{name}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.{fmt}"
+    return Response(stream_with_context(chunks), mimetype=EXPORT_FORMATS[fmt], headers={
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        # Let reverse proxies pass chunks through instead of buffering the export
+        'X-Accel-Buffering': 'no',
+        'Cache-Control': 'no-store',
+    })
+
+def export_messages(fmt, after_id=None, until_id=None):
+    """Stream contact messages in id order
+    
+    Rows come off the cursor BATCH_SIZE at a time, so memory stays flat
+    regardless of table size. Clients resume an interrupted download with
+    ``after_id`` set to the last id they received.
+    """
+    batches = _message_rows(after_id, until_id)
+    if fmt == 'csv':
+        chunks = _csv(batches, message_schema.keys)
+    else:
+        chunks = _ndjson(batches)
+    return _streaming_response(chunks, fmt, 'messages')
+
+def export_portfolio(after_id=None, until_id=None, include_messages=True):
+    """Stream every portfolio table as NDJSON records of ``{"type": ..., "data": ...}``
+    
+    The id range applies to messages only, the one table that can grow
+    large; the content tables are always exported in full.
+    """
+    def batches():
+        for record_type, model, schema in PORTFOLIO_TABLES:
+            statement = select(model).order_by(model.id).execution_options(yield_per=BATCH_SIZE)
+            for partition in db.session.scalars(statement).partitions():
+                yield [(record_type, schema.dump(obj)) for obj in partition]
+        if include_messages:
+            for batch in _message_rows(after_id, until_id):
+                yield [('message', item) for item in batch]
+    
+    chunks = _ndjson(batches(), wrap=lambda item: {'type': item[0], 'data': item[1]})
+    return _streaming_response(chunks, 'ndjson', 'portfolio')
@@ -0,0 +1,193 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from flask import current_app, request, send_file
+from werkzeug.utils import safe_join
+
+try:
+    from PIL import Image, features
+except ImportError:  # optional, originals are served unchanged without it
+    Image = None
+
+SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp'}
+FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+    'png': ('PNG', 'image/png'),
+}
+# Bump to invalidate every cached derivative after changing the encoder settings
+RENDER_VERSION = 1
+
+class ImageNotFound(Exception):
+    pass
+
+class RenderBusy(Exception):
+    """A derivative didn't finish within IMAGE_RENDER_TIMEOUT"""
+
+def render_derivative(source, target, width, image_format, quality):
+    """Resize and re-encode one image; runs in a worker process"""
+    with Image.open(source) as image:
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        
+        tmp = f'{target}.{os.getpid()}.tmp'
+        options = {'optimize': True}
+        if image_format in ('WEBP', 'JPEG'):
+            options['quality'] = quality
+        image.save(tmp, image_format, **options)
+    os.replace(tmp, target)
+    return os.path.getsize(target)
+
+class DerivativeCache:
+    """Content-addressed, size-bounded disk cache of resized images
+    
+    Derivatives are rendered in a process pool on first request. Concurrent
+    requests for the same derivative share one render. When the cache grows
+    past ``max_bytes`` the least recently served files are evicted.
+    """
+    
+    def __init__(self, directory, max_bytes, workers=2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self._executor = None
+        self._pending = {}
+        self._digests = {}
+        self._size = None
+        self._lock = threading.Lock()
+    
+    def source_digest(self, source):
+        stat = os.stat(source)
+        key = (source, stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(source, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._digests[key] = digest
+        return digest
+    
+    def path_for(self, source, width, fmt, quality):
+        key = f'{self.source_digest(source)}:{width}:{fmt}:{quality}:{RENDER_VERSION}'
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name[:2], f'{name}.{fmt}')
+    
+    def get(self, source, width, fmt, quality, timeout=30):
+        target = self.path_for(source, width, fmt, quality)
+        if os.path.exists(target):
+            # mtime doubles as the last-served time for eviction
+            os.utime(target)
+            return target
+        
+        with self._lock:
+            future = self._pending.get(target)
+            if future is None:
+                if self._executor is None:
+                    # spawn: forking a threaded server process is not safe
+                    context = multiprocessing.get_context('spawn')
+                    self._executor = ProcessPoolExecutor(self.workers, mp_context=context)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                future = self._executor.submit(render_derivative, source, target, width,
+                                              FORMATS[fmt][0], quality)
+                self._pending[target] = future
+        try:
+            size = future.result(timeout)
+        except FutureTimeout:
+            # The render keeps going; a retry is served from the cache or joins it
+            raise RenderBusy('Image is still being rendered, try again shortly')
+        finally:
+            with self._lock:
+                if self._pending.get(target) is future and future.done():
+                    del self._pending[target]
+        
+        self._account(size)
+        return target
+    
+    def _account(self, size):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+    
+    def _scan(self):
+        for directory, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+    
+    def _evict(self):
+        # Drop the least recently served files down to 90% of the budget
+        files = sorted(self._scan(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size = total
+
+def negotiate_format(requested, source):
+    """Pick the output format from ?fmt= or the Accept header"""
+    if requested:
+        requested = 'jpeg' if requested == 'jpg' else requested
+        if requested not in FORMATS:
+            raise ValueError(f'Unsupported format: {requested}')
+        return requested
+    if request.accept_mimetypes['image/webp'] and features.check('webp'):
+        return 'webp'
+    original = os.path.splitext(source)[1].lower().lstrip('.')
+    return 'jpeg' if original in ('jpg', 'jpeg') else 'png'
+
+def snap_width(width, widths):
+    """Round up to one of the configured widths so the cache stays bounded"""
+    for candidate in widths:
+        if candidate >= width:
+            return candidate
+    return widths[-1]
+
+def get_cache(app):
+    cache = app.extensions.get('image_cache')
+    if cache is None:
+        cache = DerivativeCache(app.config['IMAGE_CACHE_DIR'], app.config['IMAGE_CACHE_MAX_BYTES'],
+                                app.config['IMAGE_WORKERS'])
+        app.extensions['image_cache'] = cache
+    return cache
+
+def serve_image(name, width=None, fmt=None):
+    app = current_app
+    source = safe_join(app.config['IMAGE_SOURCE_DIR'] or os.path.join(app.static_folder, 'images'), name)
+    if source is None or os.path.splitext(source)[1].lower() not in SOURCE_EXTENSIONS or not os.path.isfile(source):
+        raise ImageNotFound(name)
+    
+    if Image is None:
+        return send_file(source, conditional=True, max_age=app.config['IMAGE_MAX_AGE'])
+    
+    widths = sorted(app.config['IMAGE_WIDTHS'])
+    if width is not None and width <= 0:
+        raise ValueError('w must be positive')
+    output_format = negotiate_format(fmt, source)
+    path = get_cache(app).get(source, snap_width(width or widths[-1], widths), output_format,
+                              app.config['IMAGE_QUALITY'], app.config['IMAGE_RENDER_TIMEOUT'])
+    
+    response = send_file(path, mimetype=FORMATS[output_format][1], conditional=True,
+                         max_age=app.config['IMAGE_MAX_AGE'])
+    if not fmt:
+        response.vary.add('Accept')
+    return response
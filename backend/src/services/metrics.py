@@ -0,0 +1,163 @@
+import hmac
+import logging
+import time
+from bisect import bisect_left
+from threading import Lock
+from flask import Response, current_app, g, has_app_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a label tuple"""
+    
+    def __init__(self, name, help, labels, buckets):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self._series = {}
+    
+    def observe(self, label_values, value):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+    
+    def render(self):
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} histogram'
+        for label_values, (counts, total) in sorted(self._series.items()):
+            labels = _labels(self.labels, label_values)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += count
+                yield f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+            yield f'{self.name}_sum{{{labels}}} {total}'
+            yield f'{self.name}_count{{{labels}}} {cumulative}'
+
+class Counter:
+    def __init__(self, name, help, labels):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._series = {}
+    
+    def inc(self, label_values, value=1):
+        self._series[label_values] = self._series.get(label_values, 0) + value
+    
+    def render(self):
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} counter'
+        for label_values, value in sorted(self._series.items()):
+            yield f'{self.name}{{{_labels(self.labels, label_values)}}} {value}'
+
+def _labels(names, values):
+    return ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                    for name, value in zip(names, values))
+
+class Registry:
+    """Per-process metrics; each WSGI worker reports its own series"""
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.requests = Counter('http_requests_total', 'Requests by endpoint and status',
+                                ('endpoint', 'method', 'status'))
+        self.latency = Histogram('http_request_duration_seconds', 'Request handling time',
+                                 ('endpoint', 'method'), LATENCY_BUCKETS)
+        self.db_time = Histogram('db_query_duration_seconds', 'SQL time per request',
+                                 ('endpoint',), LATENCY_BUCKETS)
+        self.db_queries = Histogram('db_queries_per_request', 'SQL statements per request',
+                                    ('endpoint',), QUERY_COUNT_BUCKETS)
+        self.slow_queries = Counter('db_slow_queries_total', 'Statements over the slow-query threshold',
+                                    ('endpoint',))
+    
+    def record_request(self, endpoint, method, status, elapsed, queries, db_time):
+        with self._lock:
+            self.requests.inc((endpoint, method, status))
+            self.latency.observe((endpoint, method), elapsed)
+            self.db_time.observe((endpoint,), db_time)
+            self.db_queries.observe((endpoint,), queries)
+    
+    def record_slow_query(self, endpoint):
+        with self._lock:
+            self.slow_queries.inc((endpoint,))
+    
+    def render(self):
+        with self._lock:
+            lines = [line for metric in (self.requests, self.latency, self.db_time, self.db_queries,
+                                         self.slow_queries) for line in metric.render()]
+        return '\n'.join(lines) + '\n'
+
+registry = Registry()
+
+def _endpoint():
+    # Unmatched URLs share one label so scanners can't grow the series without bound
+    return request.endpoint or 'unmatched'
+
+def _before_request():
+    g.metrics = {'started': time.perf_counter(), 'queries': 0, 'db_time': 0.0}
+
+def _after_request(response):
+    stats = g.pop('metrics', None)
+    if stats is None:
+        return response
+    elapsed = time.perf_counter() - stats['started']
+    registry.record_request(_endpoint(), request.method, response.status_code,
+                            elapsed, stats['queries'], stats['db_time'])
+    if current_app.config['METRICS_SERVER_TIMING']:
+        response.headers.add('Server-Timing',
+                             f'db;dur={stats["db_time"] * 1000:.2f};desc="{stats["queries"]} queries"')
+        response.headers.add('Server-Timing',
+                             f'app;dur={(elapsed - stats["db_time"]) * 1000:.2f}')
+    return response
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info['query_started'].pop()
+    elapsed = time.perf_counter() - started
+    if not has_app_context():
+        return
+    
+    stats = g.get('metrics')
+    if stats is not None:
+        stats['queries'] += 1
+        stats['db_time'] += elapsed
+    threshold = current_app.config['METRICS_SLOW_QUERY_MS']
+    if threshold is not None and elapsed * 1000 >= threshold:
+        endpoint = _endpoint() if stats is not None else 'background'
+        registry.record_slow_query(endpoint)
+        logger.warning('Slow query (%.1f ms) in %s: %s', elapsed * 1000, endpoint, ' '.join(statement.split()))
+
+def _handle_error(conn_context):
+    # A failed statement never reaches after_cursor_execute
+    started = conn_context.connection.info.get('query_started') if conn_context.connection is not None else None
+    if started:
+        started.pop()
+
+def metrics_view():
+    token = current_app.config['METRICS_TOKEN']
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return Response('Unauthorized\n', status=401, mimetype='text/plain')
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+def init_metrics(app, db):
+    """Time requests and SQL statements; call after db.init_app(app)"""
+    if not app.config['METRICS_ENABLED']:
+        return
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    # Traffic and latency per endpoint are not for the public; no token, no endpoint
+    if app.config['METRICS_TOKEN']:
+        app.add_url_rule('/metrics', 'metrics', metrics_view)
+    with app.app_context():
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(engine, 'handle_error', _handle_error)
@@ -0,0 +1,59 @@
+import base64
+import json
+from datetime import datetime
+from flask import request
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+class InvalidPageRequest(ValueError):
+    pass
+
+def encode_cursor(*values):
+    """Opaque cursor for the last row of a page"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+def decode_cursor(token, types):
+    """Decode a cursor back into values of the given types (datetime or int)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        return [
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, payload)
+        ]
+    except (ValueError, TypeError):
+        raise InvalidPageRequest('Invalid cursor')
+
+def page_args(cursor_types):
+    """Read ``limit`` and ``cursor`` from the query string"""
+    try:
+        limit = int(request.args.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise InvalidPageRequest('limit must be an integer')
+    if limit < 1:
+        raise InvalidPageRequest('limit must be positive')
+    
+    cursor = request.args.get('cursor')
+    return min(limit, MAX_LIMIT), decode_cursor(cursor, cursor_types) if cursor else None
+
+def keyset_page(query, limit, cursor_of):
+    """Fetch one page plus a lookahead row and build the next cursor
+    
+    ``query`` may also be a list of queries over consecutive key ranges;
+    each runs only if the ones before it came back short.
+    """
+    rows = []
+    for part in query if isinstance(query, list) else [query]:
+        rows.extend(part.limit(limit + 1 - len(rows)).all())
+        if len(rows) > limit:
+            break
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(*cursor_of(rows[-1]))
+    return rows, next_cursor
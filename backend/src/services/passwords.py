@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from threading import BoundedSemaphore, Lock
+from werkzeug.security import check_password_hash, generate_password_hash
+
+class HasherBusy(Exception):
+    """Every worker is busy and the queue is full, or a hash timed out"""
+
+class PasswordHasher:
+    """Runs password hashing on a few dedicated threads with a bounded queue
+    
+    hashlib's scrypt and PBKDF2 release the GIL, so a small thread pool caps
+    how many cores logins can take without a process pool's startup cost.
+    Callers over ``workers + max_queue`` are rejected instead of waiting.
+    """
+    
+    def __init__(self, workers=2, max_queue=8, timeout=10, method='scrypt'):
+        self.pid = os.getpid()
+        self.timeout = timeout
+        self.method = method
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self._slots = BoundedSemaphore(workers + max_queue)
+        self._current_prefix = None
+    
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy('Too many concurrent logins, try again shortly')
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            # The worker keeps its slot until the hash finishes, so a backlog still sheds load
+            raise HasherBusy('Password check timed out, try again shortly')
+    
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+    
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+    
+    def needs_rehash(self, password_hash):
+        """True when the hash was made with another method or other parameters"""
+        if self._current_prefix is None:
+            # e.g. "scrypt:32768:8:1" or "pbkdf2:sha256:1000000"
+            self._current_prefix = generate_password_hash('', self.method).split('$', 1)[0]
+        return password_hash.split('$', 1)[0] != self._current_prefix
+    
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+_start_lock = Lock()
+
+def get_hasher(app):
+    """The process's hasher, created on first use so forked workers each get their own"""
+    hasher = app.extensions.get('password_hasher')
+    if hasher is None or hasher.pid != os.getpid():
+        with _start_lock:
+            hasher = app.extensions.get('password_hasher')
+            if hasher is None or hasher.pid != os.getpid():
+                hasher = PasswordHasher(
+                    workers=app.config['PASSWORD_HASH_WORKERS'],
+                    max_queue=app.config['PASSWORD_HASH_QUEUE'],
+                    timeout=app.config['PASSWORD_HASH_TIMEOUT'],
+                    method=app.config['PASSWORD_HASH_METHOD']
+                )
+                app.extensions['password_hasher'] = hasher
+    return hasher
@@ -0,0 +1,127 @@
+import json
+from urllib.parse import urlencode
+from sqlalchemy import event
+from src.models.portfolio import db, AdminUser, Project
+from src.services.bulk import MESSAGE_ACTIONS, update_messages
+
+# Extra query strings worth auditing, per endpoint
+QUERY_VARIANTS = {
+    'portfolio.get_projects': [{}, {'featured': 'true'}, {'tech': 'Flask'}],
+    'admin.get_projects': [{'limit': 1}],
+    'admin.get_messages': [{'limit': 1}],
+    'portfolio.search_portfolio': [{'q': 'react'}],
+    'admin.search_messages': [{'q': 'hello'}],
+    # A full export is a rowid walk by design; audit the ranged/resumed form
+    'admin.export_messages_stream': [{'after_id': 0, 'until_id': 1000}],
+}
+
+# Filters accepted by POST /api/admin/messages/bulk, audited inside a rolled-back transaction
+BULK_MESSAGE_FILTERS = [
+    {'email': 'visitor@example.com'},
+    {'is_read': False},
+    {'before': '2026-01-01T00:00:00'},
+]
+
+# Tables that hold a handful of rows by design
+FIXED_SIZE_TABLES = {'personal_info', 'stat_counters', 'sqlite_master'}
+
+def _is_full_scan(detail):
+    # "SCAN <table>" walks the whole table; "SCAN ... USING [COVERING] INDEX" is an
+    # ordered index walk and a bare "SEARCH <table>" is an unindexed min()/max();
+    # "SCAN <fts> VIRTUAL TABLE INDEX" is an FTS5 MATCH lookup
+    words = detail.split()
+    if len(words) < 2 or words[0] not in ('SCAN', 'SEARCH') or ' USING ' in detail or ' VIRTUAL TABLE ' in detail:
+        return False
+    return words[1] not in FIXED_SIZE_TABLES and detail != 'SCAN CONSTANT ROW'
+
+def _sample_urls(app, rule, sample_ids):
+    values = {arg: sample_ids.get(arg, 1) for arg in rule.arguments}
+    # Build the list before returning so no request context stays pushed while callers run requests
+    with app.test_request_context():
+        path = app.url_for(rule.endpoint, **values)
+    return [path + ('?' + urlencode(args) if args else '') for args in QUERY_VARIANTS.get(rule.endpoint, [{}])]
+
+def route_urls(app, blueprints=('portfolio', 'admin'), sample_ids=None):
+    """Yield (endpoint, url) for every GET route of the blueprints and its query variants"""
+    for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+        if rule.endpoint.split('.')[0] in blueprints and 'GET' in rule.methods:
+            for url in _sample_urls(app, rule, sample_ids or {}):
+                yield rule.endpoint, url
+
+def audit_queries(app, blueprints=('portfolio', 'admin')):
+    """Run every GET route of the blueprints and EXPLAIN each statement they issue
+    
+    The filtered bulk message actions are run too, and rolled back.
+    
+    Returns a list of (endpoint, statement, plan rows, full-scan rows).
+    """
+    with app.app_context():
+        engine = db.engine
+        admin = AdminUser.query.first()
+        project = Project.query.first()
+        sample_ids = {'project_id': project.id if project else 1}
+    
+    captured = []
+    current = {}
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(('EXPLAIN', 'PRAGMA')):
+            captured.append((current.get('endpoint'), statement, parameters))
+    
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        client = app.test_client()
+        if admin:
+            with client.session_transaction() as session:
+                session['admin_id'] = admin.id
+        
+        for endpoint, url in route_urls(app, blueprints, sample_ids):
+            current['endpoint'] = endpoint
+            response = client.get(url)
+            # Follow one cursor so keyset predicates get audited too
+            payload = response.get_json(silent=True) or {}
+            if isinstance(payload, dict) and payload.get('next_cursor'):
+                joiner = '&' if '?' in url else '?'
+                client.get(f"{url}{joiner}cursor={payload['next_cursor']}")
+        
+        # The filtered bulk actions only exist as writes; run them and roll back
+        current['endpoint'] = 'admin.bulk_messages'
+        with app.app_context():
+            try:
+                for filters in BULK_MESSAGE_FILTERS:
+                    for action in MESSAGE_ACTIONS:
+                        update_messages(action, filters=filters)
+            finally:
+                db.session.rollback()
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+    
+    results = []
+    seen = set()
+    with app.app_context(), db.engine.connect() as conn:
+        for endpoint, statement, parameters in captured:
+            key = (endpoint, statement)
+            if key in seen:
+                continue
+            seen.add(key)
+            plan = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).fetchall()
+            details = [row[-1] for row in plan]
+            results.append((endpoint, statement, details, [d for d in details if _is_full_scan(d)]))
+    return results
+
+def format_report(results, as_json=False):
+    if as_json:
+        return json.dumps([
+            {'endpoint': endpoint, 'statement': statement, 'plan': plan, 'full_scans': scans}
+            for endpoint, statement, plan, scans in results
+        ], indent=2)
+    
+    lines = []
+    for endpoint, statement, plan, scans in results:
+        marker = 'FULL SCAN' if scans else 'ok'
+        lines.append(f'[{marker}] {endpoint}')
+        lines.append('    ' + ' '.join(statement.split()))
+        lines.extend(f'      {detail}' for detail in plan)
+    total = sum(1 for result in results if result[3])
+    lines.append(f'{len(results)} statements audited, {total} with full table scans')
+    return '\n'.join(lines)
@@ -0,0 +1,124 @@
+import math
+import threading
+import time
+from functools import wraps
+from flask import current_app, jsonify, request
+
+class MemoryBucketStore:
+    """Token buckets kept in a dict, one O(1) update per check
+    
+    Buckets that have refilled completely hold no information, so they are
+    dropped by a periodic compaction pass instead of living forever.
+    """
+    
+    def __init__(self, compact_interval=60):
+        self.compact_interval = compact_interval
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._next_compaction = time.monotonic() + compact_interval
+    
+    def consume(self, key, rate, capacity, cost=1):
+        """Take ``cost`` tokens; return (allowed, seconds until allowed)"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = capacity
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            
+            if tokens >= cost:
+                tokens -= cost
+                allowed, retry_after = True, 0
+            else:
+                allowed, retry_after = False, (cost - tokens) / rate
+            self._buckets[key] = (tokens, now, rate, capacity)
+            
+            if now >= self._next_compaction:
+                self._compact(now)
+        return allowed, retry_after
+    
+    def _compact(self, now):
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if bucket[0] + (now - bucket[1]) * bucket[2] < bucket[3]
+        }
+        self._next_compaction = now + self.compact_interval
+    
+    def __len__(self):
+        return len(self._buckets)
+
+class RedisBucketStore:
+    """Token buckets shared by every worker through Redis"""
+    
+    # Refill and take in one atomic step; buckets expire once they would be full
+    SCRIPT = '''
+    local tokens = tonumber(redis.call('HGET', KEYS[1], 't') or ARGV[2])
+    local updated = tonumber(redis.call('HGET', KEYS[1], 'u') or ARGV[4])
+    local rate, capacity, cost, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+    local allowed = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 't', tokens, 'u', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+    return {allowed, tostring((cost - tokens) / rate)}
+    '''
+    
+    def __init__(self, url, prefix='ratelimit:'):
+        import redis
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+    
+    def consume(self, key, rate, capacity, cost=1):
+        allowed, retry_after = self._script(keys=[self.prefix + key], args=[rate, capacity, cost, time.time()])
+        return bool(allowed), max(0.0, float(retry_after))
+
+def get_store(app):
+    store = app.extensions.get('ratelimit_store')
+    if store is None:
+        url = app.config['RATELIMIT_STORAGE_URL']
+        if url.startswith('redis'):
+            store = RedisBucketStore(url)
+        else:
+            store = MemoryBucketStore()
+        app.extensions['ratelimit_store'] = store
+    return store
+
+def client_ip():
+    return request.remote_addr or 'unknown'
+
+def login_username():
+    data = request.get_json(silent=True)
+    username = data.get('username') if isinstance(data, dict) else None
+    return username.strip().lower() if isinstance(username, str) and username.strip() else None
+
+def rate_limited(*limits):
+    """Reject requests over any of the named limits with 429 before the view runs
+    
+    Each limit is ``(name, key_func)``; RATELIMIT_RULES[name] gives its
+    ``(capacity, period_seconds)``. A key_func returning None skips that limit.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            app = current_app
+            if app.config['RATELIMIT_ENABLED']:
+                store = get_store(app)
+                for name, key_func in limits:
+                    key = key_func()
+                    if key is None:
+                        continue
+                    capacity, period = app.config['RATELIMIT_RULES'][name]
+                    allowed, retry_after = store.consume(f'{name}:{key}', capacity / period, capacity)
+                    if not allowed:
+                        response = jsonify({'success': False, 'message': 'Too many requests'})
+                        response.status_code = 429
+                        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+                        return response
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
@@ -0,0 +1,237 @@
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from flask import Response, current_app, jsonify, request
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import make_url
+from src.services.cache import bump_content_version, content_changed
+from src.services.search import FTS_INDEXES
+from src.services.stats import COUNTER_QUERIES
+
+logger = logging.getLogger(__name__)
+
+CURRENT_NAME = 'CURRENT'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# Connection-level headers that must not be copied across a proxy hop
+HOP_BY_HOP = {'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization', 'te',
+              'trailers', 'transfer-encoding', 'upgrade', 'host', 'content-length'}
+
+def _database_path(app):
+    database = make_url(app.config['SQLALCHEMY_DATABASE_URI']).database
+    if not database or database == ':memory:':
+        raise ValueError('Replication needs a file-backed SQLite database')
+    return database
+
+def _write_atomic(path, text):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def current_snapshot(directory):
+    """Path of the newest published snapshot, or None"""
+    try:
+        with open(os.path.join(directory, CURRENT_NAME)) as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return os.path.join(directory, name) if name else None
+
+def _scrub(connection, tables):
+    """Empty ``tables`` and everything derived from them in a snapshot copy"""
+    # Replicas only serve public content; keep messages and credentials on the primary
+    for table in tables:
+        connection.execute(f'DELETE FROM {table}')
+    
+    existing = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for index, (table, _, _) in FTS_INDEXES.items():
+        if table in tables and index in existing:
+            # External-content FTS5 segments keep every indexed term until cleared
+            connection.execute(f"INSERT INTO {index}({index}) VALUES ('delete-all')")
+    
+    # Dashboard counters would otherwise still count the scrubbed rows
+    dialect = sqlite.dialect()
+    for name, query in COUNTER_QUERIES.items():
+        sql = query().compile(dialect=dialect, compile_kwargs={'literal_binds': True})
+        connection.execute(f'UPDATE stat_counters SET value = ({sql}) WHERE name = ?', (name,))
+
+def publish_snapshot(app, directory, keep=3):
+    """Copy the live database into ``directory`` with the online backup API
+    
+    The copy is consistent even while writers are active. Tables listed in
+    REPLICATION_SCRUB_TABLES are emptied along with their search indexes,
+    dashboard counters are recomputed, and the copy is switched to
+    rollback-journal mode so replicas can open it read-only and immutable,
+    then published by atomically rewriting CURRENT. Only the newest ``keep``
+    snapshots are retained.
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = datetime.now(timezone.utc).strftime('snapshot-%Y%m%dT%H%M%S%fZ.db')
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.db')
+    os.close(fd)
+    
+    source = sqlite3.connect(_database_path(app))
+    target = sqlite3.connect(tmp)
+    try:
+        source.backup(target)
+        _scrub(target, app.config['REPLICATION_SCRUB_TABLES'])
+        target.commit()
+        target.execute('VACUUM')
+        target.execute('PRAGMA journal_mode=DELETE')
+    finally:
+        target.close()
+        source.close()
+    with open(tmp, 'rb') as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, os.path.join(directory, name))
+    _write_atomic(os.path.join(directory, CURRENT_NAME), name)
+    
+    snapshots = sorted(n for n in os.listdir(directory) if n.startswith('snapshot-') and n.endswith('.db'))
+    for old in snapshots[:-keep]:
+        # Replicas still reading an old snapshot keep their open file handle
+        os.unlink(os.path.join(directory, old))
+    return os.path.join(directory, name)
+
+def _init_primary(app, directory):
+    pending = threading.Event()
+    started = []
+    lock = threading.Lock()
+    
+    def worker():
+        while True:
+            pending.wait()
+            pending.clear()
+            try:
+                publish_snapshot(app, directory, app.config['REPLICATION_KEEP'])
+            except Exception:
+                logger.exception('Publishing a replica snapshot failed')
+    
+    def schedule(*args, **kwargs):
+        # Started on first use so a pre-forking server doesn't fork a live thread
+        with lock:
+            if not started:
+                threading.Thread(target=worker, name='replication-publish', daemon=True).start()
+                started.append(True)
+        pending.set()
+    
+    content_changed.connect(schedule, weak=False)
+    app.extensions['replication_publish'] = schedule
+
+class SnapshotReader:
+    """Read-only connections to the newest snapshot, swapped in without restarts"""
+    
+    def __init__(self, app, directory, interval):
+        self.app = app
+        self.directory = directory
+        self.interval = interval
+        self.path = current_snapshot(directory)
+        if self.path is None:
+            raise RuntimeError(f'No published snapshot in {directory}')
+        self._started = False
+        self._lock = threading.Lock()
+    
+    def uri(self):
+        """SQLite URI for a new read-only connection to the current snapshot"""
+        path = self.path
+        if not os.path.exists(path):
+            # Pruned by a burst of publishes within one poll interval; the
+            # poller moves self.path over (and drops cached responses) next run
+            path = current_snapshot(self.directory) or path
+        # immutable: snapshots never change after publishing, so no locks or -shm files
+        return f'file:{path}?mode=ro&immutable=1'
+    
+    def connect(self):
+        return sqlite3.connect(self.uri(), uri=True, check_same_thread=False)
+    
+    def refresh(self):
+        """Switch to a newer snapshot if one was published; returns True on a swap"""
+        path = current_snapshot(self.directory)
+        if path is None or path == self.path or not os.path.exists(path):
+            return False
+        self.path = path
+        from src.models.portfolio import db
+        with self.app.app_context():
+            # Pooled connections to the old file are closed as they are checked in
+            db.engine.dispose()
+        bump_content_version()
+        logger.info('Switched to snapshot %s', path)
+        return True
+    
+    def start(self):
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        
+        def poll():
+            while True:
+                time.sleep(self.interval)
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception('Snapshot refresh failed')
+        threading.Thread(target=poll, name='replication-poll', daemon=True).start()
+
+def forward_to_primary():
+    """Proxy the current request to PRIMARY_URL and relay its response"""
+    primary = current_app.config['PRIMARY_URL'].rstrip('/')
+    headers = {key: value for key, value in request.headers if key.lower() not in HOP_BY_HOP}
+    forwarded_for = request.headers.get('X-Forwarded-For')
+    headers['X-Forwarded-For'] = f'{forwarded_for}, {request.remote_addr}' if forwarded_for else request.remote_addr
+    outgoing = urllib.request.Request(primary + request.full_path.rstrip('?'), data=request.get_data() or None,
+                                      headers=headers, method=request.method)
+    try:
+        upstream = urllib.request.urlopen(outgoing, timeout=current_app.config['PRIMARY_TIMEOUT'])
+    except urllib.error.HTTPError as e:
+        upstream = e
+    except (urllib.error.URLError, OSError):
+        return jsonify({'success': False, 'message': 'Primary server unavailable'}), 502
+    
+    with upstream:
+        body = upstream.read()
+        headers = [(key, value) for key, value in upstream.headers.items() if key.lower() not in HOP_BY_HOP]
+    return Response(body, status=upstream.status, headers=headers)
+
+def _init_replica(app):
+    reader = app.extensions['replication_reader']
+    
+    @app.before_request
+    def route_writes_to_primary():
+        reader.start()
+        if request.path.startswith('/api/') and (request.blueprint != 'portfolio' or request.method not in SAFE_METHODS):
+            return forward_to_primary()
+
+def configure_replication(app):
+    """Point a replica's engine at the newest snapshot; call before db.init_app(app)"""
+    role = app.config['REPLICATION_ROLE']
+    if role is None:
+        return
+    if role not in ('primary', 'replica'):
+        raise RuntimeError(f'Unknown REPLICATION_ROLE: {role}')
+    if not app.config['REPLICATION_DIR']:
+        raise RuntimeError('REPLICATION_DIR must be set when REPLICATION_ROLE is set')
+    if role == 'replica':
+        if not app.config['PRIMARY_URL']:
+            raise RuntimeError('PRIMARY_URL must be set on a replica')
+        reader = SnapshotReader(app, app.config['REPLICATION_DIR'], app.config['REPLICATION_POLL_INTERVAL'])
+        app.extensions['replication_reader'] = reader
+        app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{reader.path}'
+        # Every new pooled connection opens whichever snapshot is current
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+                                                       creator=reader.connect)
+
+def init_replication(app):
+    """Publish snapshots (primary) or route writes to the primary (replica); call after db.init_app(app)"""
+    role = app.config['REPLICATION_ROLE']
+    if role == 'primary':
+        _init_primary(app, app.config['REPLICATION_DIR'])
+    elif role == 'replica':
+        _init_replica(app)
@@ -0,0 +1,124 @@
+import re
+from html import escape
+from flask import request
+from sqlalchemy import text
+from src.models.portfolio import db
+
+# FTS5 index name -> (content table, indexed columns, bm25 column weights)
+FTS_INDEXES = {
+    'projects_fts': ('projects', ('title', 'subtitle', 'description', 'long_description'), (10.0, 5.0, 2.0, 1.0)),
+    'experience_fts': ('experience', ('title', 'company', 'description'), (10.0, 5.0, 1.0)),
+    'contact_messages_fts': ('contact_messages', ('name', 'email', 'subject', 'message'), (4.0, 4.0, 3.0, 1.0)),
+}
+
+# Control characters can't come from the indexed text, so they are safe markers
+# to turn into <mark> after the snippet has been HTML-escaped
+_MARK_OPEN, _MARK_CLOSE = '\x02', '\x03'
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+# engine URL -> whether the FTS5 indexes exist
+_available = {}
+
+def _create_statements(name, table, columns):
+    cols = ', '.join(columns)
+    new = ', '.join(f'new.{c}' for c in columns)
+    old = ', '.join(f'old.{c}' for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({cols}, content='{table}', "
+        f"content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {name}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        # Only reindex when an indexed column changes, not on e.g. is_read toggles
+        f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {name}(rowid, {cols}) VALUES (new.id, {new}); END",
+    ]
+
+def fts5_supported(connection):
+    options = {row[0] for row in connection.exec_driver_sql('PRAGMA compile_options')}
+    return 'ENABLE_FTS5' in options
+
+def init_search():
+    """Create the FTS5 indexes and their sync triggers, backfilling new indexes"""
+    connection = db.session.connection()
+    if connection.dialect.name != 'sqlite' or not fts5_supported(connection):
+        _available[str(db.engine.url)] = False
+        return False
+    
+    existing = {row[0] for row in connection.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for name, (table, columns, _) in FTS_INDEXES.items():
+        for statement in _create_statements(name, table, columns):
+            connection.exec_driver_sql(statement)
+        if name not in existing:
+            connection.exec_driver_sql(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+    db.session.commit()
+    _available[str(db.engine.url)] = True
+    return True
+
+def search_available():
+    key = str(db.engine.url)
+    if key not in _available:
+        names = {row[0] for row in db.session.execute(text(
+            "SELECT name FROM sqlite_master WHERE name IN ('projects_fts', 'experience_fts', 'contact_messages_fts')"))}
+        _available[key] = len(names) == len(FTS_INDEXES)
+    return _available[key]
+
+def match_expression(query):
+    """Turn free text into an FTS5 query: every word required, last one as a prefix"""
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        raise ValueError('Search query must contain at least one word')
+    terms = [f'"{token}"' for token in tokens[:-1]] + [f'"{tokens[-1]}"*']
+    return ' '.join(terms)
+
+def search_args(default_limit=20, max_limit=50):
+    """Read ``q`` and ``limit`` from the query string"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        raise ValueError('q is required')
+    try:
+        limit = int(request.args.get('limit', default_limit))
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return query, min(limit, max_limit)
+
+def _highlight(snippet):
+    if snippet is None:
+        return None
+    return escape(snippet).replace(_MARK_OPEN, '<mark>').replace(_MARK_CLOSE, '</mark>')
+
+def search(index, query, limit=20, columns=('id',)):
+    """Ranked matches from one FTS index as dicts with ``snippet`` and ``score``"""
+    table, _, weights = FTS_INDEXES[index]
+    select_columns = ', '.join(f't.{column}' for column in columns)
+    
+    if search_available():
+        rows = db.session.execute(text(
+            f"SELECT {select_columns}, "
+            f"snippet({index}, -1, :open, :close, '…', 16) AS snippet, "
+            f"bm25({index}, {', '.join(map(str, weights))}) AS rank "
+            f"FROM {index} JOIN {table} t ON t.id = {index}.rowid "
+            f"WHERE {index} MATCH :match ORDER BY rank LIMIT :limit"
+        ), {'open': _MARK_OPEN, 'close': _MARK_CLOSE, 'match': match_expression(query), 'limit': limit})
+        return [
+            dict(zip(columns, row[:len(columns)]), snippet=_highlight(row.snippet), score=round(-row.rank, 4))
+            for row in rows
+        ]
+    
+    # Without FTS5: unranked substring scan over the same columns
+    _, indexed, _ = FTS_INDEXES[index]
+    words = _TOKEN.findall(query)
+    if not words:
+        raise ValueError('Search query must contain at least one word')
+    haystack = " || ' ' || ".join(f"coalesce(t.{column}, '')" for column in indexed)
+    conditions = ' AND '.join(f'{haystack} LIKE :w{i}' for i in range(len(words)))
+    params = {f'w{i}': f'%{word}%' for i, word in enumerate(words)}
+    rows = db.session.execute(text(
+        f"SELECT {select_columns} FROM {table} t WHERE {conditions} ORDER BY t.id DESC LIMIT :limit"
+    ), dict(params, limit=limit))
+    return [dict(zip(columns, row), snippet=None, score=None) for row in rows]
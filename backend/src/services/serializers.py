@@ -0,0 +1,124 @@
+from operator import attrgetter
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+def isoformat(value):
+    return value.isoformat() if value is not None else None
+
+class Schema:
+    """Declarative model serializer
+    
+    Each field maps an output key to a model attribute, optionally through a
+    converter: ``Schema(id='id', created_at=('created_at', isoformat))``.
+    All attributes are fetched through one precompiled attrgetter call.
+    """
+    
+    def __init__(self, **fields):
+        self.fields = fields
+        self.keys = tuple(fields)
+        self.converters = []
+        attrs = []
+        for index, spec in enumerate(fields.values()):
+            if isinstance(spec, tuple):
+                spec, convert = spec
+                self.converters.append((index, convert))
+            attrs.append(spec)
+        
+        getter = attrgetter(*attrs)
+        # attrgetter returns a bare value rather than a tuple for one attribute
+        self._getter = getter if len(attrs) > 1 else (lambda obj: (getter(obj),))
+    
+    def extend(self, **fields):
+        return Schema(**{**self.fields, **fields})
+    
+    def dump(self, obj):
+        values = self._getter(obj)
+        if self.converters:
+            values = list(values)
+            for index, convert in self.converters:
+                values[index] = convert(values[index])
+        return dict(zip(self.keys, values))
+    
+    def dump_many(self, objs):
+        dump = self.dump
+        return [dump(obj) for obj in objs]
+
+# Public views
+personal_info_schema = Schema(
+    name='name', title='title', email='email', phone='phone',
+    location='location', summary='summary'
+)
+
+project_schema = Schema(
+    id='id', title='title', subtitle='subtitle', description='description',
+    long_description='long_description', technologies='technology_list',
+    features='feature_list', image_url='image_url', live_url='live_url',
+    github_url='github_url', status='status', is_featured='is_featured'
+)
+
+skill_schema = Schema(id='id', name='name', level='level', description='description')
+
+experience_schema = Schema(
+    id='id', title='title', company='company', period='period',
+    location='location', description='description',
+    responsibilities='responsibility_list', projects='project_list'
+)
+
+education_schema = Schema(
+    id='id', degree='degree', field='field', institution='institution',
+    period='period', description='description'
+)
+
+language_schema = Schema(id='id', name='name', level='level')
+
+# Admin views
+admin_personal_info_schema = Schema(id='id').extend(**personal_info_schema.fields)
+
+admin_project_schema = project_schema.extend(
+    order_index='order_index', created_at=('created_at', isoformat)
+)
+
+admin_skill_schema = Schema(
+    id='id', name='name', category='category', level='level',
+    description='description', order_index='order_index'
+)
+
+message_schema = Schema(
+    id='id', name='name', email='email', subject='subject', message='message',
+    is_read='is_read', created_at=('created_at', isoformat)
+)
+
+message_summary_schema = Schema(
+    id='id', name='name', email='email', subject='subject',
+    created_at=('created_at', isoformat), is_read='is_read'
+)
+
+admin_user_schema = Schema(id='id', username='username', email='email')
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj, **kwargs).decode('utf-8')
+    
+    def dumps_bytes(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+def init_json(app):
+    """Switch the app to orjson when it is installed"""
+    if orjson is not None and app.config.get('JSON_USE_ORJSON', True):
+        app.json = ORJSONProvider(app)
@@ -0,0 +1,82 @@
+import os
+from sqlalchemy import event
+
+# Named tuning profiles for SQLite engines. "default" leaves SQLite and the
+# SQLAlchemy pool as they are; "production" is tuned for concurrent readers
+# alongside contact-form and admin writers.
+SQLITE_PROFILES = {
+    'default': {
+        'pragmas': {},
+        'engine_options': {},
+    },
+    'production': {
+        'pragmas': {
+            # Readers no longer block behind the writer and vice versa
+            'journal_mode': 'WAL',
+            # Safe with WAL: a crash can lose the last commits but never corrupts
+            'synchronous': 'NORMAL',
+            'busy_timeout': 5000,
+            'mmap_size': 256 * 1024 * 1024,
+            # Negative values are KiB, so 64 MiB of page cache per connection
+            'cache_size': -64 * 1024,
+            'temp_store': 'MEMORY',
+        },
+        'engine_options': {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 10,
+            'connect_args': {'timeout': 5, 'check_same_thread': False},
+        },
+    },
+}
+
+def _is_memory_database(uri):
+    return uri in ('sqlite://', 'sqlite:///:memory:') or 'mode=memory' in uri
+
+def _set_pragmas(pragmas):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+    return on_connect
+
+def configure_sqlite_engine(app):
+    """Apply the SQLITE_PROFILE engine options; call before db.init_app(app)"""
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    if not uri.startswith('sqlite'):
+        return
+    
+    name = app.config.setdefault('SQLITE_PROFILE', os.environ.get('SQLITE_PROFILE', 'production'))
+    profile = SQLITE_PROFILES[name]
+    
+    options = dict(profile['engine_options'])
+    if _is_memory_database(uri):
+        # In-memory databases use a single-connection pool without sizing knobs
+        options = {}
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+def profile_pragmas(app):
+    """The connection pragmas for the app's SQLITE_PROFILE and SQLITE_PRAGMAS"""
+    name = app.config.get('SQLITE_PROFILE')
+    if name is None:
+        return {}
+    
+    pragmas = dict(SQLITE_PROFILES[name]['pragmas'])
+    pragmas.update(app.config.get('SQLITE_PRAGMAS', {}))
+    if _is_memory_database(app.config['SQLALCHEMY_DATABASE_URI']):
+        pragmas.pop('journal_mode', None)
+    return pragmas
+
+def attach_pragmas(engine, pragmas):
+    """Run ``pragmas`` on every new connection of a (sync) engine"""
+    if pragmas:
+        event.listen(engine, 'connect', _set_pragmas(pragmas))
+
+def init_sqlite_pragmas(app, db):
+    """Run the profile's pragmas on every new connection; call after db.init_app(app)"""
+    pragmas = profile_pragmas(app)
+    if pragmas:
+        with app.app_context():
+            attach_pragmas(db.engine, pragmas)
@@ -0,0 +1,137 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from src.models.portfolio import Project
+from src.services.cache import content_changed
+from src.services.static_files import compressed_variants
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+# Public routes that can't be prerendered: free-text queries, binary files, writes
+SKIPPED_ENDPOINTS = {'portfolio.search_portfolio', 'portfolio.get_image', 'portfolio.submit_contact'}
+# Extra files for query-string variants: endpoint -> [(file suffix, query args)]
+EXPORT_VARIANTS = {
+    'portfolio.get_projects': [('/featured', {'featured': 'true'})],
+}
+
+def export_urls(app):
+    """Yield (url, query args, relative file path) for every exportable public route"""
+    project_ids = [row.id for row in Project.query.with_entities(Project.id).order_by(Project.id)]
+    with app.test_request_context():
+        for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+            if (not rule.endpoint.startswith('portfolio.') or rule.endpoint in SKIPPED_ENDPOINTS
+                    or 'GET' not in rule.methods):
+                continue
+            if rule.arguments == {'project_id'}:
+                values_list = [{'project_id': project_id} for project_id in project_ids]
+            elif rule.arguments:
+                continue
+            else:
+                values_list = [{}]
+            
+            for values in values_list:
+                url = app.url_for(rule.endpoint, **values)
+                yield url, {}, url.lstrip('/') + '.json'
+                for suffix, args in EXPORT_VARIANTS.get(rule.endpoint, []):
+                    yield url, args, url.lstrip('/') + suffix + '.json'
+
+def export_manifest_path(out_dir):
+    return os.path.join(out_dir, 'api', 'portfolio', MANIFEST_NAME)
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.export-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def export_static(app, out_dir):
+    """Render every public route to ``<out_dir>/<url>.json`` plus .gz/.br variants
+    
+    Files are replaced atomically, files from the previous export that are
+    no longer rendered (deleted projects) are removed, and the manifest,
+    which lists the SRI hash and size of every file, is written last.
+    """
+    client = app.test_client()
+    manifest_path = export_manifest_path(out_dir)
+    
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            previous = json.load(f).get('files', {})
+    
+    with app.app_context():
+        urls = list(export_urls(app))
+    
+    files = {}
+    for url, args, relative in urls:
+        response = client.get(url, query_string=args)
+        if response.status_code != 200:
+            raise RuntimeError(f'{url} returned {response.status_code}')
+        body = response.get_data()
+        
+        outputs = [(relative, body), *((relative + suffix, data) for suffix, data in compressed_variants(body))]
+        for name, data in outputs:
+            path = os.path.join(out_dir, name)
+            _write_atomic(path, data)
+            digest = base64.b64encode(hashlib.sha384(data).digest()).decode('ascii')
+            files[name] = {'integrity': f'sha384-{digest}', 'size': len(data)}
+    
+    for name in previous.keys() - files.keys():
+        try:
+            os.unlink(os.path.join(out_dir, name))
+        except FileNotFoundError:
+            pass
+    
+    # Last, so a server watching the manifest (StaticIndex) sees the finished export
+    _write_atomic(manifest_path, json.dumps({
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'files': files,
+    }, indent=2, sort_keys=True).encode('utf-8'))
+    return files
+
+def init_static_export(app):
+    """Re-export in a background thread after content commits, if enabled
+    
+    Bursts of commits are coalesced: changes that arrive during an export
+    trigger exactly one more run after it.
+    """
+    if not app.config['STATIC_EXPORT_ON_CHANGE']:
+        return
+    out_dir = app.config['STATIC_EXPORT_DIR'] or app.static_folder
+    pending = threading.Event()
+    
+    def worker():
+        while True:
+            pending.wait()
+            pending.clear()
+            try:
+                export_static(app, out_dir)
+            except Exception:
+                logger.exception('Static export failed')
+    
+    started = []
+    lock = threading.Lock()
+    
+    def schedule(*args, **kwargs):
+        # Started on first use so a pre-forking server doesn't fork a live thread
+        with lock:
+            if not started:
+                threading.Thread(target=worker, name='static-export', daemon=True).start()
+                started.append(True)
+        pending.set()
+    
+    # A closure would be dropped by blinker's default weak reference
+    content_changed.connect(schedule, weak=False)
+    app.extensions['static_export'] = schedule
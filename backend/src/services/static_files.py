@@ -0,0 +1,145 @@
+import gzip
+import mimetypes
+import os
+import re
+import time
+from flask import request, send_file
+
+try:
+    import brotli
+except ImportError:  # optional, only gzip variants are built without it
+    brotli = None
+
+# Vite build output such as assets/index-BL4nKdBo.js never changes content
+HASHED_ASSET = re.compile(r'^assets/.+-[A-Za-z0-9_-]{8}\.[a-z0-9]+$')
+COMPRESSIBLE_EXTENSIONS = {'.html', '.js', '.mjs', '.css', '.svg', '.json', '.txt', '.xml', '.map', '.ico', '.webmanifest'}
+# Preferred order when the client accepts several encodings
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+class StaticFile:
+    __slots__ = ('path', 'size', 'mtime', 'mimetype', 'hashed', 'variants')
+    
+    def __init__(self, path, stat, hashed):
+        self.path = path
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.hashed = hashed
+        self.variants = []
+
+class StaticIndex:
+    """In-memory index of the static folder, built at startup
+    
+    Requests are resolved with a dict lookup instead of filesystem probes, and
+    precompressed .br/.gz siblings are attached to their source file. If
+    ``watch`` names a file (the static export manifest), its mtime is checked
+    at most every ``check_interval`` seconds and the index is rebuilt when it
+    changes, so exports written by another process are picked up.
+    """
+    
+    def __init__(self, root, max_age=3600, watch=None, check_interval=1.0):
+        self.root = root
+        self.max_age = max_age
+        self.watch = watch
+        self.check_interval = check_interval
+        self.files = {}
+        self._watch_stamp = self._stamp()
+        self._next_check = time.monotonic() + check_interval
+        self.build()
+    
+    def _stamp(self):
+        if self.watch is None:
+            return None
+        try:
+            return os.stat(self.watch).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def _check_watch(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        stamp = self._stamp()
+        if stamp != self._watch_stamp:
+            self._watch_stamp = stamp
+            self.build()
+    
+    def build(self):
+        files = {}
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith(tuple(suffix for _, suffix in ENCODINGS)):
+                    continue
+                path = os.path.join(directory, name)
+                key = os.path.relpath(path, self.root).replace(os.sep, '/')
+                entry = StaticFile(path, os.stat(path), bool(HASHED_ASSET.match(key)))
+                for encoding, suffix in ENCODINGS:
+                    variant = path + suffix
+                    # Ignore variants left over from an older build of the file
+                    if os.path.exists(variant) and os.stat(variant).st_mtime >= entry.mtime:
+                        entry.variants.append((encoding, variant))
+                files[key] = entry
+        self.files = files
+    
+    def get(self, path):
+        if self.watch is not None:
+            self._check_watch()
+        return self.files.get(path)
+    
+    def send(self, entry):
+        path = entry.path
+        encoding = None
+        # Byte ranges are served from the identity representation only
+        if entry.variants and 'Range' not in request.headers:
+            for candidate, variant in entry.variants:
+                if request.accept_encodings[candidate]:
+                    encoding, path = candidate, variant
+                    break
+        
+        if entry.hashed:
+            max_age = IMMUTABLE_MAX_AGE
+        elif entry.mimetype == 'text/html':
+            # Always revalidate the SPA shell so new asset hashes are picked up
+            max_age = None
+        else:
+            max_age = self.max_age
+        
+        response = send_file(path, mimetype=entry.mimetype, conditional=True,
+                             last_modified=entry.mtime, max_age=max_age)
+        if entry.hashed:
+            response.cache_control.immutable = True
+        if encoding:
+            response.content_encoding = encoding
+        if entry.variants:
+            response.vary.add('Accept-Encoding')
+        return response
+
+def compressed_variants(data, level=9):
+    """(suffix, bytes) for each encoding that actually shrinks ``data``"""
+    variants = [('.gz', gzip.compress(data, compresslevel=level, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    # Not worth serving if it doesn't shrink the file
+    return [(suffix, compressed) for suffix, compressed in variants if len(compressed) < len(data)]
+
+def compress_static(root, min_size=1024, level=9):
+    """Write .gz (and .br when brotli is installed) next to compressible files"""
+    written = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) < min_size:
+                continue
+            
+            for suffix, compressed in compressed_variants(data, level):
+                with open(path + suffix, 'wb') as f:
+                    f.write(compressed)
+                written.append((path + suffix, len(data), len(compressed)))
+    return written
@@ -0,0 +1,83 @@
+from sqlalchemy import event, func, inspect, select
+from src.models.portfolio import db, Project, Skill, ContactMessage, StatCounter
+
+# Dashboard counters and the queries that compute them from scratch
+COUNTER_QUERIES = {
+    'total_projects': lambda: select(func.count()).select_from(Project),
+    'featured_projects': lambda: select(func.count()).select_from(Project).where(Project.is_featured == True),
+    'total_skills': lambda: select(func.count()).select_from(Skill),
+    'unread_messages': lambda: select(func.count()).select_from(ContactMessage).where(ContactMessage.is_read == False),
+    'total_messages': lambda: select(func.count()).select_from(ContactMessage),
+}
+
+def recount_stats():
+    """Recompute every counter from its table, e.g. after setup or raw SQL writes"""
+    for name, query in COUNTER_QUERIES.items():
+        value = db.session.execute(query()).scalar()
+        counter = db.session.get(StatCounter, name)
+        if counter is None:
+            db.session.add(StatCounter(name=name, value=value))
+        else:
+            counter.value = value
+    db.session.commit()
+
+def get_stats():
+    """All counters in one primary-key scan"""
+    stats = dict.fromkeys(COUNTER_QUERIES, 0)
+    stats.update(db.session.query(StatCounter.name, StatCounter.value).all())
+    return stats
+
+def bump_counters(connection, **deltas):
+    """Apply counter deltas inside the caller's transaction"""
+    table = StatCounter.__table__
+    for name, delta in deltas.items():
+        if delta:
+            connection.execute(
+                table.update().where(table.c.name == name).values(value=table.c.value + delta)
+            )
+
+def _changed(target, attr):
+    """Return (old, new) for an attribute modified in this flush, or None"""
+    history = inspect(target).attrs[attr].history
+    if not history.added:
+        return None
+    old = history.deleted[0] if history.deleted else None
+    return bool(old), bool(history.added[0])
+
+@event.listens_for(Project, 'after_insert')
+def _project_inserted(mapper, connection, target):
+    bump_counters(connection, total_projects=1, featured_projects=int(bool(target.is_featured)))
+
+@event.listens_for(Project, 'after_delete')
+def _project_deleted(mapper, connection, target):
+    bump_counters(connection, total_projects=-1, featured_projects=-int(bool(target.is_featured)))
+
+@event.listens_for(Project, 'after_update')
+def _project_updated(mapper, connection, target):
+    changed = _changed(target, 'is_featured')
+    if changed:
+        old, new = changed
+        bump_counters(connection, featured_projects=int(new) - int(old))
+
+@event.listens_for(Skill, 'after_insert')
+def _skill_inserted(mapper, connection, target):
+    bump_counters(connection, total_skills=1)
+
+@event.listens_for(Skill, 'after_delete')
+def _skill_deleted(mapper, connection, target):
+    bump_counters(connection, total_skills=-1)
+
+@event.listens_for(ContactMessage, 'after_insert')
+def _message_inserted(mapper, connection, target):
+    bump_counters(connection, total_messages=1, unread_messages=int(not target.is_read))
+
+@event.listens_for(ContactMessage, 'after_delete')
+def _message_deleted(mapper, connection, target):
+    bump_counters(connection, total_messages=-1, unread_messages=-int(not target.is_read))
+
+@event.listens_for(ContactMessage, 'after_update')
+def _message_updated(mapper, connection, target):
+    changed = _changed(target, 'is_read')
+    if changed:
+        old, new = changed
+        bump_counters(connection, unread_messages=int(not new) - int(not old))
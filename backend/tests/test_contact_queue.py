@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.commands import init_db
+from src.main import create_app
+from src.models.portfolio import db, ContactMessage, SpoolAck
+from src.services.contact_queue import DEAD_LETTER_FILE, ContactQueue, get_contact_queue
+from src.services.stats import get_stats
+
+def _record(seq, **overrides):
+    record = {
+        'name': f'Visitor {seq}',
+        'email': 'visitor@example.com',
+        'subject': 'Hello',
+        'message': 'Hi there',
+        'created_at': datetime(2026, 1, 1).isoformat(),
+        'seq': seq,
+    }
+    record.update(overrides)
+    return record
+
+def _dead_letters(spool_dir):
+    path = os.path.join(spool_dir, DEAD_LETTER_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as dead:
+        return [json.loads(line) for line in dead]
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'contact.db'}",
+        'CONTACT_SPOOL_DIR': str(tmp_path / 'spool'),
+        'CONTACT_FLUSH_INTERVAL': 0.05,
+        'CONTACT_SPOOL_FSYNC': False,
+        'RATELIMIT_ENABLED': False,
+        'METRICS_ENABLED': False,
+    })
+    with app.app_context():
+        init_db()
+    yield app
+    contact_queue = app.extensions.get('contact_queue')
+    if contact_queue:
+        contact_queue.stop()
+
+def test_rejects_non_string_fields(app):
+    response = app.test_client().post('/api/portfolio/contact', json={
+        'name': ['x'], 'email': 'a@example.com', 'subject': 'Hi', 'message': 'Hello',
+    })
+    assert response.status_code == 400
+    assert 'contact_queue' not in app.extensions
+
+def test_rejects_empty_fields(app):
+    response = app.test_client().post('/api/portfolio/contact', json={
+        'name': ' ', 'email': 'a@example.com', 'subject': 'Hi', 'message': 'Hello',
+    })
+    assert response.status_code == 400
+
+def test_bad_row_is_dead_lettered_without_blocking_the_batch(app):
+    contact_queue = ContactQueue(app, app.config['CONTACT_SPOOL_DIR'])
+    os.makedirs(contact_queue.spool_dir)
+    batch = [_record(1), _record(2, name=['x']), _record(3)]
+    
+    assert contact_queue._store('contact-test', batch) == 3
+    
+    with app.app_context():
+        assert sorted(m.name for m in ContactMessage.query) == ['Visitor 1', 'Visitor 3']
+        assert db.session.get(SpoolAck, 'contact-test').seq == 3
+    assert [dead['record']['seq'] for dead in _dead_letters(contact_queue.spool_dir)] == [2]
+
+def test_recovers_unacked_records_from_a_dead_spool(app):
+    spool_dir = app.config['CONTACT_SPOOL_DIR']
+    os.makedirs(spool_dir)
+    lines = [json.dumps(_record(seq)) for seq in (1, 2)]
+    lines.append(json.dumps(_record(3, message={'not': 'text'})))
+    lines.append('["no sequence"]')
+    lines.append(json.dumps(_record(4)))
+    lines.append('{"name": "torn')
+    with open(os.path.join(spool_dir, 'contact-1-dead.spool'), 'w', encoding='utf-8') as spool:
+        spool.write('\n'.join(lines))
+    with app.app_context():
+        # Record 1 was committed before the crash
+        db.session.add(ContactMessage(**{k: v for k, v in _record(1).items() if k not in ('seq', 'created_at')}))
+        db.session.add(SpoolAck(spool='contact-1-dead', seq=1))
+        db.session.commit()
+    
+    get_contact_queue(app)
+    
+    assert not os.path.exists(os.path.join(spool_dir, 'contact-1-dead.spool'))
+    with app.app_context():
+        assert sorted(m.name for m in ContactMessage.query) == ['Visitor 1', 'Visitor 2', 'Visitor 4']
+        assert db.session.get(SpoolAck, 'contact-1-dead') is None
+        assert get_stats()['total_messages'] == 3
+    assert len(_dead_letters(spool_dir)) == 2
+
+def test_writer_commits_and_removes_its_spool_on_stop(app):
+    http = app.test_client()
+    for i in range(3):
+        response = http.post('/api/portfolio/contact', json={
+            'name': f'Visitor {i}', 'email': 'a@example.com', 'subject': 'Hi', 'message': 'Hello',
+        })
+        assert response.status_code == 202
+    contact_queue = app.extensions['contact_queue']
+    spool_path = contact_queue._spool_path
+    contact_queue.stop()
+    
+    assert not os.path.exists(spool_path)
+    with app.app_context():
+        assert ContactMessage.query.count() == 3
+        assert SpoolAck.query.count() == 0
@@ -0,0 +1,52 @@
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.commands import init_db, init_default_data
+from src.main import create_app
+from src.models.portfolio import db, ContactMessage, SpoolAck
+from src.services.replication import publish_snapshot
+
+TOKEN = 'Zyxwvutsecret'
+
+@pytest.fixture
+def snapshot(tmp_path):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'primary.db'}",
+        'RATELIMIT_ENABLED': False,
+        'METRICS_ENABLED': False,
+    })
+    with app.app_context():
+        init_db()
+        init_default_data()
+        for i in range(50):
+            db.session.add(ContactMessage(name=f'{TOKEN} Sender', email=f'{TOKEN.lower()}{i}@example.com',
+                                          subject='Private', message=f'{TOKEN} message body {i}'))
+        db.session.add(SpoolAck(spool='contact-1-abc', seq=7))
+        db.session.commit()
+    return publish_snapshot(app, str(tmp_path / 'replication'))
+
+def test_snapshot_bytes_hold_no_scrubbed_text(snapshot):
+    with open(snapshot, 'rb') as f:
+        data = f.read()
+    assert TOKEN.encode() not in data
+    assert TOKEN.lower().encode() not in data
+
+def test_snapshot_scrubs_derived_tables(snapshot):
+    connection = sqlite3.connect(snapshot)
+    try:
+        assert connection.execute('SELECT count(*) FROM contact_messages').fetchone()[0] == 0
+        assert connection.execute('SELECT count(*) FROM contact_spool_acks').fetchone()[0] == 0
+        assert connection.execute('SELECT count(*) FROM admin_users').fetchone()[0] == 0
+        assert connection.execute(
+            "SELECT count(*) FROM contact_messages_fts WHERE contact_messages_fts MATCH 'sender'").fetchone()[0] == 0
+        counters = dict(connection.execute('SELECT name, value FROM stat_counters'))
+        assert counters['total_messages'] == 0
+        assert counters['unread_messages'] == 0
+        assert counters['total_projects'] > 0
+    finally:
+        connection.close()